@@ -1,16 +1,24 @@
 # Unified Bot Detection API - Single Endpoint with Modular Functions
-from flask import Flask, request, jsonify
+from flask import Flask, request
 from flask_cors import CORS
-from datetime import datetime
-import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import orjson
 import os
-from pathlib import Path
+import queue
+import socket
+import threading
 import logging
 
 # Import our modular functions
 from modules.ml_model import MLModelModule
 from modules.honeypot import HoneypotModule
 from modules.fingerprinting import FingerprintingModule
+from modules.timeutil import utc_timestamp
+from prediction_log import (
+    LEGACY_PREDICTIONS_FILE, LOGS_DIR, MAX_PREDICTIONS, MAX_RECORD_SIZE, PREDICTIONS_FILE, PredictionLog, read_tail
+)
 
 app = Flask(__name__)
 CORS(app)
@@ -25,115 +33,331 @@ ml_module = MLModelModule()
 honeypot_module = HoneypotModule()
 fingerprinting_module = FingerprintingModule()
 
-# Setup logging directory
-BASE_DIR = Path(__file__).parent.parent
-LOGS_DIR = BASE_DIR / 'logs' / 'predictions'
+# Setup logging directory (file location and retention are defined in prediction_log.py)
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
-PREDICTIONS_FILE = LOGS_DIR / 'api_predictions.json'
 
-def save_prediction(data):
-    """Save prediction to JSON file"""
+# Predictions are written by a background thread so /predict never waits on disk I/O
+PREDICTION_QUEUE_SIZE = 10000
+PREDICTION_BATCH_SIZE = 100
+
+# ML results are memoized by a hash of the event stream; bots replay identical streams
+ML_CACHE_SIZE = 4096
+
+# ML inference runs on this pool while the request thread does the fingerprint analysis
+MODULE_POOL_WORKERS = 4
+
+# Optional out-of-process logging: when set, records are sent as datagrams to log_collector.py
+PREDICTION_LOG_SOCKET = os.environ.get('PREDICTION_LOG_SOCKET')
+
+# /predictions serves the most recent records, read from the end of the shared log file
+RECENT_PREDICTIONS = 50
+
+# Module results carry numpy scalars (e.g. from the ML heuristics)
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+# Final decision weights: honeypot detection is most reliable (45%), ML model (35%), fingerprinting (20%)
+# Honeypots get highest weight because they detect definitive bot behavior
+HONEYPOT_WEIGHT = 0.45     # Increased from 0.15 - honeypots are most reliable
+ML_WEIGHT = 0.35           # Reduced from 0.50 - ML can have false positives
+FINGERPRINT_WEIGHT = 0.20  # Reduced from 0.35 - supporting evidence
+HONEYPOT_TRIGGER_BONUS = 0.15  # Added per triggered honeypot
+HIGH_RISK_INDICATORS = frozenset({'webdriver_detected', 'no_plugins', 'no_mime_types'})
+
+# Two or more triggered honeypots are a definitive bot signal: the trigger bonus alone
+# exceeds the ultra-sensitive threshold, so the weighted score is not computed
+TRIPWIRE_MIN_TRIGGERS = 2
+TRIPWIRE_VERDICT = {
+    'is_bot': True,
+    'bot_probability': 1.0,
+    'risk_level': 'high',
+    'recommendation': 'block',
+    'decision_threshold': 0.1
+}
+
+# Static parts of the API responses, built once and shared by reference
+API_ARCHITECTURE = 'modular_single_api'
+API_VERSION = '3.0'
+MODULES_USED = ('ml_model', 'honeypot', 'fingerprinting')
+ERROR_API_METADATA = {'architecture': API_ARCHITECTURE, 'error_fallback': True}
+DETAILED_API_INFO = {
+    'architecture': 'modular_single_api_enhanced',
+    'version': '3.1',
+    'fingerprinting_features': 'rule_based_enhanced'
+}
+
+# Verdict used when module results are missing the sections the decision needs
+COMBINATION_FALLBACK_VERDICT = {
+    'is_bot': True,
+    'confidence': 0.8,
+    'bot_probability': 0.9,
+    'risk_level': 'high',
+    'recommendation': 'block',
+    'decision_logic': 'combination_error: incomplete module results'
+}
+
+# Stand-in ML result when honeypots or the WebDriver flag already confirm a bot
+ML_SKIPPED_RESULT = {
+    'bot': True,
+    'confidence': 0.95,
+    'reconstruction_error': 0.9,
+    'raw_error': 0,
+    'decision_logic': 'ml_skipped: definitive bot signal from cheaper checks'
+}
+
+# Every gunicorn worker (and log_collector.py) appends to the same file; PredictionLog locks each
+# write and rotation and follows the file when another writer rotates it, so no records are lost
+_prediction_log = PredictionLog()
+
+def _migrate_legacy_predictions():
+    """Convert the old single-array predictions file to JSONL once"""
+    if PREDICTIONS_FILE.exists() or not LEGACY_PREDICTIONS_FILE.exists():
+        return
     try:
-        if PREDICTIONS_FILE.exists():
-            with open(PREDICTIONS_FILE, 'r') as f:
-                predictions = json.load(f)
-        else:
-            predictions = []
-        
-        predictions.append(data)
-        
-        # Keep only last 1000 predictions to prevent file from getting too large
-        if len(predictions) > 1000:
-            predictions = predictions[-1000:]
-        
-        with open(PREDICTIONS_FILE, 'w') as f:
-            json.dump(predictions, f, indent=2)
-        
-        logger.info(f"💾 Prediction saved to {PREDICTIONS_FILE}")
+        # Every worker runs this at import; the log lock lets exactly one of them convert the file
+        with _prediction_log.locked():
+            if PREDICTIONS_FILE.exists():
+                return
+            with open(LEGACY_PREDICTIONS_FILE, 'rb') as f:
+                predictions = orjson.loads(f.read())[-MAX_PREDICTIONS:]
+            tmp_file = PREDICTIONS_FILE.with_suffix('.jsonl.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.writelines(orjson.dumps(p, option=ORJSON_OPTIONS) + b'\n' for p in predictions)
+            os.replace(tmp_file, PREDICTIONS_FILE)
+        logger.info("📦 Migrated %d predictions to %s", len(predictions), PREDICTIONS_FILE)
     except Exception as e:
-        logger.error(f"❌ Error saving prediction: {e}")
+        logger.error("❌ Error migrating legacy predictions: %s", e)
+
+_migrate_legacy_predictions()
+
+def _write_predictions(records):
+    """Append a batch of predictions to the JSONL log"""
+    lines = [orjson.dumps(record, option=ORJSON_OPTIONS) + b'\n' for record in records]
+    # Keeps only the last MAX_PREDICTIONS records once the file reaches PREDICTIONS_ROTATE_AT
+    _prediction_log.append(lines)
+
+def _prediction_writer():
+    """Background worker: drain queued predictions and write them in batches"""
+    while True:
+        batch = [_prediction_queue.get()]
+        while len(batch) < PREDICTION_BATCH_SIZE:
+            try:
+                batch.append(_prediction_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_predictions(batch)
+            logger.info("💾 %d prediction(s) saved to %s", len(batch), PREDICTIONS_FILE)
+        except Exception as e:
+            logger.error("❌ Error saving prediction: %s", e)
+        finally:
+            for _ in batch:
+                _prediction_queue.task_done()
+
+_prediction_queue = queue.Queue(maxsize=PREDICTION_QUEUE_SIZE)
+threading.Thread(target=_prediction_writer, name='prediction-writer', daemon=True).start()
+
+def _connect_log_socket():
+    """Connect to the log collector's datagram socket, if one is configured"""
+    if not PREDICTION_LOG_SOCKET or not hasattr(socket, 'AF_UNIX'):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    try:
+        sock.connect(PREDICTION_LOG_SOCKET)
+    except OSError as e:
+        logger.warning("⚠️ Log collector not reachable at %s (%s) - writing predictions in-process", PREDICTION_LOG_SOCKET, e)
+        sock.close()
+        return None
+    logger.info("📡 Sending predictions to log collector at %s", PREDICTION_LOG_SOCKET)
+    return sock
+
+_log_socket = _connect_log_socket()
+
+def save_prediction(data):
+    """Send prediction to the log collector, or queue it for the background writer"""
+    if _log_socket is not None:
+        record = orjson.dumps(data, option=ORJSON_OPTIONS)
+        # One datagram per record; oversized records, a full buffer or a stopped collector fall back to the queue
+        if len(record) <= MAX_RECORD_SIZE:
+            try:
+                _log_socket.send(record)
+                return
+            except OSError:
+                pass
+    try:
+        _prediction_queue.put_nowait(data)
+    except queue.Full:
+        logger.error("❌ Prediction log queue is full - dropping prediction")
+
+_module_pool = ThreadPoolExecutor(max_workers=MODULE_POOL_WORKERS, thread_name_prefix='module-worker')
+
+_ml_cache = OrderedDict()
+_ml_cache_lock = threading.Lock()
+
+def predict_ml_cached(events):
+    """Run the ML module, reusing the result for an identical event stream"""
+    # Results are flat dicts of scalars; callers get their own copy so the cached entry never changes
+    key = hashlib.blake2b(orjson.dumps(events, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+    with _ml_cache_lock:
+        result = _ml_cache.get(key)
+        if result is not None:
+            _ml_cache.move_to_end(key)
+            return dict(result)
+    
+    result = ml_module.predict(events)
+    if result.get('method') != 'error_fallback':
+        with _ml_cache_lock:
+            _ml_cache[key] = result
+            if len(_ml_cache) > ML_CACHE_SIZE:
+                _ml_cache.popitem(last=False)
+    return dict(result)
+
+def orjson_response(data, status=200):
+    """Serialize a response body with orjson instead of flask.jsonify"""
+    return app.response_class(orjson.dumps(data, option=ORJSON_OPTIONS), status=status, mimetype='application/json')
+
+# Module configuration does not change after startup, so get_info() is only called once
+_MODULE_INFO = {
+    'ml_model': ml_module.get_info(),
+    'honeypot': honeypot_module.get_info(),
+    'fingerprinting': fingerprinting_module.get_info()
+}
+
+def get_module_info():
+    """Cached module info, with the live fingerprinting signature counters"""
+    return {
+        **_MODULE_INFO,
+        'fingerprinting': {
+            **_MODULE_INFO['fingerprinting'],
+            'signature_tracking': fingerprinting_module.get_signature_tracking_counts()
+        }
+    }
+
+# Fields /predict cannot work without
+PREDICT_REQUIRED_FIELDS = ('mouseMoveCount', 'keyPressCount', 'events')
+PREDICT_OBJECT_FIELDS = ('honeypot_data', 'browserFingerprint', 'fingerprintRisk', 'metadata')
+
+def parse_json_body():
+    """Decode the request body with orjson; None unless it is a JSON object"""
+    try:
+        data = orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
 
 @app.route('/health')
 def health():
     """Health check for the unified API"""
-    module_status = {
-        'ml_model': ml_module.get_info(),
-        'honeypot': honeypot_module.get_info(),
-        'fingerprinting': fingerprinting_module.get_info()
-    }
-    
-    return jsonify({
+    return orjson_response({
         'status': 'healthy',
         'service': 'unified_bot_detection_api',
-        'timestamp': datetime.utcnow().isoformat() + 'Z',
-        'architecture': 'modular_single_api',
-        'modules': module_status
+        'timestamp': utc_timestamp(),
+        'architecture': API_ARCHITECTURE,
+        'modules': get_module_info()
     })
 
 @app.route('/predict', methods=['POST'])
 def predict():
     """Main prediction endpoint - uses all modules and returns frontend-compatible response"""
+    # One timestamp per request, shared by metadata, response, log and error path
+    current_timestamp = utc_timestamp()
+    data = parse_json_body()
+    logger.info("📥 Incoming prediction request from %s", request.remote_addr)
+    
+    # Validate input data
+    if not data:
+        return orjson_response({"error": "No data provided"}, 400)
+    
+    # Extract required fields
+    if not all(field in data for field in PREDICT_REQUIRED_FIELDS):
+        return orjson_response({"error": "mouseMoveCount, keyPressCount, and events are required"}, 400)
+    if not isinstance(data['events'], list) or not all(isinstance(data.get(field, {}), dict) for field in PREDICT_OBJECT_FIELDS):
+        return orjson_response({"error": "events must be a list and honeypot_data, browserFingerprint, fingerprintRisk and metadata must be objects"}, 400)
+    
+    mouse_move_count = data['mouseMoveCount']
+    key_press_count = data['keyPressCount']
+    events = data['events']
+    
+    # Extract honeypot data from frontend
+    honeypot_data = data.get('honeypot_data', {})
+    
+    # Extract enhanced fingerprinting data
+    browser_fingerprint = data.get('browserFingerprint', {})
+    fingerprint_risk = data.get('fingerprintRisk', {})
+    enhanced_metadata = data.get('metadata', {})
+    
+    # Prepare metadata (combine traditional, enhanced, and honeypot data)
+    metadata = {
+        'ip_address': request.remote_addr,
+        'user_agent': request.headers.get('User-Agent'),
+        'timestamp': current_timestamp
+    }
+    
+    # Add enhanced metadata if available
+    metadata.update(enhanced_metadata)
+    
+    # Add honeypot-specific metadata
+    if honeypot_data:
+        metadata.update({
+            'hidden_honeypot_field': honeypot_data.get('hidden_honeypot_field', ''),
+            'fake_submit_clicked': honeypot_data.get('fake_submit_clicked', False),
+            'js_optional_field': honeypot_data.get('js_optional_field', ''),
+            'js_enabled': honeypot_data.get('js_enabled', True),
+            'honeypot_triggers': honeypot_data.get('honeypot_triggers', {})
+        })
+    
     try:
-        data = request.json
-        logger.info(f"📥 Incoming prediction request from {request.remote_addr}")
-        
-        # Validate input data
-        if not data:
-            return jsonify({"error": "No data provided"}), 400
-        
-        # Extract required fields
-        if 'mouseMoveCount' not in data or 'keyPressCount' not in data or 'events' not in data:
-            return jsonify({"error": "mouseMoveCount, keyPressCount, and events are required"}), 400
-        
-        mouse_move_count = data.get('mouseMoveCount')
-        key_press_count = data.get('keyPressCount')
-        events = data.get('events', [])
-        
-        # Extract honeypot data from frontend
-        honeypot_data = data.get('honeypot_data', {})
-        
-        # Extract enhanced fingerprinting data
-        browser_fingerprint = data.get('browserFingerprint', {})
-        fingerprint_risk = data.get('fingerprintRisk', {})
-        enhanced_metadata = data.get('metadata', {})
-        
-        # Prepare metadata (combine traditional, enhanced, and honeypot data)
-        metadata = {
-            'ip_address': request.remote_addr,
-            'user_agent': request.headers.get('User-Agent'),
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
-        }
-        
-        # Add enhanced metadata if available
-        metadata.update(enhanced_metadata)
-        
-        # Add honeypot-specific metadata
-        if honeypot_data:
-            metadata.update({
-                'hidden_honeypot_field': honeypot_data.get('hidden_honeypot_field', ''),
-                'fake_submit_clicked': honeypot_data.get('fake_submit_clicked', False),
-                'js_optional_field': honeypot_data.get('js_optional_field', ''),
-                'js_enabled': honeypot_data.get('js_enabled', True),
-                'honeypot_triggers': honeypot_data.get('honeypot_triggers', {})
-            })
-        
-        current_timestamp = datetime.utcnow().isoformat() + 'Z'
-        
         # Run all modules with enhanced data
         logger.info("🔄 Running all detection modules with enhanced fingerprinting...")
         
-        # 1. ML Model Analysis
-        ml_result = ml_module.predict(events)
-        
-        # 2. Enhanced Honeypot Analysis (3-layer detection)
+        # 1. Enhanced Honeypot Analysis (3-layer detection) - cheapest and most definitive, so it runs first
         honeypot_result = honeypot_module.analyze(events, metadata)
         
+        # 2. ML Model Analysis - skipped when the request is already a confirmed bot,
+        #    otherwise started on the module pool so it overlaps with fingerprinting
+        ml_future = None
+        triggered_honeypots = honeypot_result.get('honeypot_summary', {}).get('triggered_honeypots', 0)
+        if triggered_honeypots >= TRIPWIRE_MIN_TRIGGERS:
+            ml_result = dict(ML_SKIPPED_RESULT, method='skipped_honeypot_tripwire')
+        elif browser_fingerprint.get('webdriver_detected'):
+            ml_result = dict(ML_SKIPPED_RESULT, method='skipped_webdriver_detected')
+        else:
+            ml_future = _module_pool.submit(predict_ml_cached, events)
+        
         # 3. Enhanced Fingerprinting Analysis
         fingerprint_result = fingerprinting_module.analyze_fingerprint(metadata, browser_fingerprint)
         
+        if ml_future is not None:
+            ml_result = ml_future.result()
+        
         # Combine results for final decision
         final_decision = combine_module_results(ml_result, honeypot_result, fingerprint_result)
         
+        # Bind the nested results once; they are read many times below
+        hp_analysis = honeypot_result['analysis']
+        hp_verdict = honeypot_result['honeypot_verdict']
+        hp_summary = honeypot_result.get('honeypot_summary', {})
+        hp_details = honeypot_result.get('honeypot_results', {})
+        fp_analysis = fingerprint_result['analysis']
+        fp_verdict = fingerprint_result['verdict']
+        bf = browser_fingerprint
+        ml_bot = ml_result.get('bot', False)
+        webdriver_detected = bf.get('webdriver_detected', False)
+        plugins_count = bf.get('plugins_count', 0)
+        mime_types_count = bf.get('mime_types_count', 0)
+        suspicious_screen = bf.get('suspicious_screen', False)
+        prediction = {
+            'bot': final_decision['is_bot'],
+            'reconstruction_error': ml_result.get('reconstruction_error', 0.5),
+            'confidence': final_decision['confidence'],
+            'raw_error': ml_result.get('raw_error', 0)
+        }
+        
+        # The verdict and prediction appear in both the response and the prediction log,
+        # so they are serialized once and embedded as pre-encoded JSON in both
+        final_decision_json = orjson.Fragment(orjson.dumps(final_decision, option=ORJSON_OPTIONS))
+        prediction_json = orjson.Fragment(orjson.dumps(prediction, option=ORJSON_OPTIONS))
+        
         # Create FRONTEND-COMPATIBLE response (matches original format)
         response = {
             # Original format that frontend expects
@@ -142,18 +366,13 @@ def predict():
             'current_timestamp': current_timestamp,
             'mouseMoveCount': mouse_move_count,
             'keyPressCount': key_press_count,
-            'prediction': [{
-                'bot': final_decision['is_bot'],
-                'reconstruction_error': ml_result.get('reconstruction_error', 0.5),
-                'confidence': final_decision['confidence'],
-                'raw_error': ml_result.get('raw_error', 0)
-            }],
+            'prediction': [prediction_json],
             
             # Enhanced data for detailed analysis
             'enhanced_analysis': {
-                'final_verdict': final_decision,
+                'final_verdict': final_decision_json,
                 'ml_analysis': {
-                    'bot_detected': ml_result.get('bot', False),
+                    'bot_detected': ml_bot,
                     'reconstruction_error': ml_result.get('reconstruction_error', 0),
                     'confidence': ml_result.get('confidence', 0.5),
                     'method': ml_result.get('method', 'unknown'),
@@ -162,34 +381,34 @@ def predict():
                     'threshold': ml_result.get('threshold_used', 300)
                 },
                 'honeypot_analysis': {
-                    'threat_detected': honeypot_result['honeypot_verdict']['is_bot'],
-                    'threat_level': honeypot_result['analysis']['threat_level'],
-                    'honeypot_score': honeypot_result['analysis'].get('honeypot_score', honeypot_result['analysis'].get('total_score', 0)),
-                    'threat_indicators': honeypot_result['analysis']['threat_indicators'],
-                    'confidence': honeypot_result['honeypot_verdict']['confidence'],
-                    'honeypot_summary': honeypot_result.get('honeypot_summary', {}),
-                    'honeypot_details': honeypot_result.get('honeypot_results', {}),
+                    'threat_detected': hp_verdict['is_bot'],
+                    'threat_level': hp_analysis['threat_level'],
+                    'honeypot_score': hp_analysis.get('honeypot_score', hp_analysis.get('total_score', 0)),
+                    'threat_indicators': hp_analysis['threat_indicators'],
+                    'confidence': hp_verdict['confidence'],
+                    'honeypot_summary': hp_summary,
+                    'honeypot_details': hp_details,
                     'detection_method': 'enhanced_3_layer_honeypot'
                 },
                 'fingerprint_analysis': {
-                    'risk_level': fingerprint_result['analysis']['risk_level'],
-                    'risk_score': fingerprint_result['analysis'].get('risk_score', 0),
-                    'is_suspicious': fingerprint_result['verdict']['is_suspicious'],
-                    'is_bot_likely': fingerprint_result['analysis'].get('is_bot_likely', False),
-                    'risk_indicators': fingerprint_result['analysis']['risk_indicators'],
-                    'total_indicators': fingerprint_result['analysis'].get('total_indicators', 0),
+                    'risk_level': fp_analysis['risk_level'],
+                    'risk_score': fp_analysis.get('risk_score', 0),
+                    'is_suspicious': fp_verdict['is_suspicious'],
+                    'is_bot_likely': fp_analysis.get('is_bot_likely', False),
+                    'risk_indicators': fp_analysis['risk_indicators'],
+                    'total_indicators': fp_analysis.get('total_indicators', 0),
                     'device_hash': fingerprint_result['fingerprint'].get('device_hash', 'unknown'),
-                    'confidence': fingerprint_result['verdict']['confidence'],
-                    'bot_probability': fingerprint_result['verdict'].get('bot_probability', 0),
+                    'confidence': fp_verdict['confidence'],
+                    'bot_probability': fp_verdict.get('bot_probability', 0),
                     'feature_analysis': {
-                        'webdriver_detected': browser_fingerprint.get('webdriver_detected', False),
-                        'plugins_count': browser_fingerprint.get('plugins_count', 0),
-                        'mime_types_count': browser_fingerprint.get('mime_types_count', 0),
-                        'screen_suspicious': browser_fingerprint.get('suspicious_screen', False),
+                        'webdriver_detected': webdriver_detected,
+                        'plugins_count': plugins_count,
+                        'mime_types_count': mime_types_count,
+                        'screen_suspicious': suspicious_screen,
                         'browser_capabilities': {
-                            'webgl': browser_fingerprint.get('webgl_supported', False),
-                            'canvas': browser_fingerprint.get('canvas_supported', False),
-                            'audio_context': browser_fingerprint.get('audio_context_supported', False)
+                            'webgl': bf.get('webgl_supported', False),
+                            'canvas': bf.get('canvas_supported', False),
+                            'audio_context': bf.get('audio_context_supported', False)
                         }
                     }
                 }
@@ -197,29 +416,31 @@ def predict():
             
             # API metadata
             'api_metadata': {
-                'architecture': 'modular_single_api',
-                'modules_used': ['ml_model', 'honeypot', 'fingerprinting'],
+                'architecture': API_ARCHITECTURE,
+                'modules_used': MODULES_USED,
                 'processing_timestamp': current_timestamp,
-                'version': '3.0'
+                'version': API_VERSION
             }
         }
         
-        # Enhanced logging with fingerprinting and honeypot details
-        logger.info(f"📊 Final Prediction Summary:")
-        logger.info(f"   🤖 Bot Decision: {final_decision['is_bot']}")
-        logger.info(f"   📊 Combined Confidence: {final_decision['confidence']:.3f}")
-        logger.info(f"   🧠 ML: {ml_result.get('bot', False)} (conf: {ml_result.get('confidence', 0):.3f})")
-        logger.info(f"   🍯 Honeypot: {honeypot_result['honeypot_verdict']['is_bot']} (threat: {honeypot_result['analysis']['threat_level']}, triggers: {honeypot_result.get('honeypot_summary', {}).get('triggered_honeypots', 0)}/3)")
-        logger.info(f"   👆 Fingerprint: {fingerprint_result['verdict']['is_suspicious']} (risk: {fingerprint_result['analysis']['risk_level']})")
-        logger.info(f"   🔍 Enhanced Features: WebDriver={browser_fingerprint.get('webdriver_detected', False)}, Plugins={browser_fingerprint.get('plugins_count', 0)}, MIME={browser_fingerprint.get('mime_types_count', 0)}")
-        
-        # Log honeypot trigger details
-        honeypot_triggers = honeypot_result.get('honeypot_results', {}).get('detailed_results', {})
-        if honeypot_triggers:
-            logger.info(f"   🎯 Honeypot Triggers:")
-            for trap_type, details in honeypot_triggers.items():
-                if details.get('triggered', False):
-                    logger.info(f"     • {trap_type}: {details.get('details', 'Triggered')}")
+        # Enhanced logging with fingerprinting and honeypot details (skipped entirely unless INFO is enabled)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📊 Final Prediction Summary:")
+            logger.info("   🤖 Bot Decision: %s", final_decision['is_bot'])
+            logger.info("   📊 Combined Confidence: %.3f", final_decision['confidence'])
+            logger.info("   🧠 ML: %s (conf: %.3f)", ml_bot, ml_result.get('confidence', 0))
+            logger.info("   🍯 Honeypot: %s (threat: %s, triggers: %s/3)",
+                        hp_verdict['is_bot'], hp_analysis['threat_level'], hp_summary.get('triggered_honeypots', 0))
+            logger.info("   👆 Fingerprint: %s (risk: %s)", fp_verdict['is_suspicious'], fp_analysis['risk_level'])
+            logger.info("   🔍 Enhanced Features: WebDriver=%s, Plugins=%s, MIME=%s",
+                        webdriver_detected, plugins_count, mime_types_count)
+            
+            # Log honeypot trigger details as a single record
+            honeypot_triggers = hp_details.get('detailed_results', {})
+            triggered_traps = [f"{trap_type}: {details.get('details', 'Triggered')}"
+                               for trap_type, details in honeypot_triggers.items() if details.get('triggered', False)]
+            if triggered_traps:
+                logger.info("   🎯 Honeypot Triggers: %s", '; '.join(triggered_traps))
         
         # Save detailed prediction log with enhanced data
         prediction_log = {
@@ -234,11 +455,11 @@ def predict():
                 'browser_fingerprint': browser_fingerprint,
                 'fingerprint_risk_assessment': fingerprint_risk,
                 'feature_summary': {
-                    'webdriver_detected': browser_fingerprint.get('webdriver_detected', False),
-                    'plugins_count': browser_fingerprint.get('plugins_count', 0),
-                    'mime_types_count': browser_fingerprint.get('mime_types_count', 0),
-                    'suspicious_screen': browser_fingerprint.get('suspicious_screen', False),
-                    'suspicious_ua_patterns': browser_fingerprint.get('suspicious_ua_patterns', [])
+                    'webdriver_detected': webdriver_detected,
+                    'plugins_count': plugins_count,
+                    'mime_types_count': mime_types_count,
+                    'suspicious_screen': suspicious_screen,
+                    'suspicious_ua_patterns': bf.get('suspicious_ua_patterns', [])
                 }
             },
             'module_results': {
@@ -246,23 +467,24 @@ def predict():
                 'honeypot': honeypot_result,
                 'fingerprinting': fingerprint_result
             },
-            'final_decision': final_decision,
-            'frontend_response': response['prediction'][0]  # Just the main prediction part
+            'final_decision': final_decision_json,
+            'frontend_response': prediction_json  # Just the main prediction part
         }
+        http_response = orjson_response(response)
         save_prediction(prediction_log)
         
         logger.info("✅ Unified prediction completed successfully")
-        return jsonify(response)
-    
+        return http_response
     except Exception as e:
-        logger.error(f"❌ API error: {e}")
+        # Module failures and malformed module results both end up here
+        logger.error("❌ API error: %s", e)
         # Return frontend-compatible error response
-        return jsonify({
+        return orjson_response({
             'ip_address': request.remote_addr,
             'user_agent': request.headers.get('User-Agent'),
-            'current_timestamp': datetime.utcnow().isoformat() + 'Z',
-            'mouseMoveCount': data.get('mouseMoveCount', 0) if data else 0,
-            'keyPressCount': data.get('keyPressCount', 0) if data else 0,
+            'current_timestamp': current_timestamp,
+            'mouseMoveCount': mouse_move_count,
+            'keyPressCount': key_press_count,
             'prediction': [{
                 'bot': True,  # Default to bot on error
                 'reconstruction_error': 0.9,
@@ -270,130 +492,135 @@ def predict():
                 'raw_error': 500
             }],
             'error': f'API processing error: {str(e)}',
-            'api_metadata': {
-                'architecture': 'modular_single_api',
-                'error_fallback': True
-            }
-        }), 500
+            'api_metadata': ERROR_API_METADATA
+        }, 500)
+
+def _contributing_factors(ml_result, fp_analysis, fp_verdict, hp_verdict):
+    """Per-module inputs to the final verdict, reported for every decision path"""
+    high_risk_indicators = fp_analysis.get('risk_indicators', [])
+    return {
+        'ml_model': {'bot': ml_result.get('bot', False), 'confidence': ml_result.get('confidence', 0.5), 'weight': ML_WEIGHT},
+        'fingerprinting': {
+            'bot_likely': fp_analysis.get('is_bot_likely', False), 
+            'risk_score': fp_analysis.get('risk_score', 0),
+            'confidence': fp_verdict['confidence'], 
+            'weight': FINGERPRINT_WEIGHT,
+            'high_risk_indicators': sum(1 for i in high_risk_indicators if i in HIGH_RISK_INDICATORS)
+        },
+        'honeypot': {'bot': hp_verdict['is_bot'], 'confidence': hp_verdict['confidence'], 'weight': HONEYPOT_WEIGHT}
+    }
 
 def combine_module_results(ml_result, honeypot_result, fingerprint_result):
     """Combine results from all modules into final decision"""
-    try:
-        # Extract individual decisions
-        ml_bot = ml_result.get('bot', False)
-        ml_confidence = ml_result.get('confidence', 0.5)
-        
-        honeypot_bot = honeypot_result['honeypot_verdict']['is_bot']
-        honeypot_confidence = honeypot_result['honeypot_verdict']['confidence']
-        
-        fingerprint_suspicious = fingerprint_result['verdict']['is_suspicious']
-        fingerprint_bot_likely = fingerprint_result['analysis'].get('is_bot_likely', False)
-        fingerprint_confidence = fingerprint_result['verdict']['confidence']
-        fingerprint_risk_score = fingerprint_result['analysis'].get('risk_score', 0)
-        
-        # Enhanced weighted decision making with honeypot priority
-        # Honeypot detection is most reliable (45%), ML model (35%), fingerprinting (20%)
-        # Honeypots get highest weight because they detect definitive bot behavior
-        honeypot_weight = 0.45  # Increased from 0.15 - honeypots are most reliable
-        ml_weight = 0.35        # Reduced from 0.50 - ML can have false positives
-        fingerprint_weight = 0.20  # Reduced from 0.35 - supporting evidence
-        
-        # Calculate weighted bot probability
-        bot_probability = (
-            (ml_bot * ml_confidence * ml_weight) +
-            (fingerprint_bot_likely * fingerprint_risk_score * fingerprint_weight) +
-            (honeypot_bot * honeypot_confidence * honeypot_weight)
-        )
-        
-        # Honeypot trigger bonus - if multiple honeypots triggered, increase probability
-        honeypot_summary = honeypot_result.get('honeypot_summary', {})
-        triggered_honeypots = honeypot_summary.get('triggered_honeypots', 0)
-        
-        if triggered_honeypots > 0:
-            # Each triggered honeypot adds a bonus
-            honeypot_bonus = triggered_honeypots * 0.15  # 15% per triggered honeypot
-            bot_probability += honeypot_bonus
-            logger.info(f"🍯 Honeypot bonus applied: +{honeypot_bonus:.3f} for {triggered_honeypots} triggers")
-        
-        # Cap probability at 1.0
-        bot_probability = min(bot_probability, 1.0)
-        
-        # Calculate combined confidence
-        combined_confidence = (
-            (ml_confidence * ml_weight) +
-            (fingerprint_confidence * fingerprint_weight) +
-            (honeypot_confidence * honeypot_weight)
-        )
-        
-        # Enhanced decision threshold with fingerprinting consideration
-        decision_threshold = 0.4
-        
-        # Special case: If multiple honeypots triggered, immediate bot detection
-        if triggered_honeypots >= 2:
-            decision_threshold = 0.1  # Almost guaranteed bot
-            logger.info(f"🚨 Multiple honeypots triggered ({triggered_honeypots}/3) - using ultra-sensitive threshold")
-        elif triggered_honeypots == 1:
-            decision_threshold = 0.25  # Very likely bot
-            logger.info(f"🚨 Single honeypot triggered - using sensitive threshold")
-        
-        # Special case: If fingerprinting detects webdriver or very high risk, lower threshold
-        high_risk_indicators = fingerprint_result['analysis'].get('risk_indicators', [])
-        if 'webdriver_detected' in high_risk_indicators:
-            decision_threshold = min(decision_threshold, 0.2)  # Take minimum of current threshold
+    # Modules always return these sections (including their error results); anything else gets the fallback verdict
+    if 'honeypot_verdict' not in honeypot_result or 'verdict' not in fingerprint_result or 'analysis' not in fingerprint_result:
+        logger.error("❌ Incomplete module results - using fallback verdict")
+        return COMBINATION_FALLBACK_VERDICT
+    
+    fp_analysis = fingerprint_result['analysis']
+    fp_verdict = fingerprint_result['verdict']
+    hp_verdict = honeypot_result['honeypot_verdict']
+    hp_summary = honeypot_result.get('honeypot_summary') or {}
+    log_info = logger.isEnabledFor(logging.INFO)
+    
+    # Honeypot tripwire: skip the weighted decision entirely
+    triggered_honeypots = hp_summary.get('triggered_honeypots', 0)
+    if triggered_honeypots >= TRIPWIRE_MIN_TRIGGERS:
+        if log_info:
+            logger.info("🚨 Multiple honeypots triggered (%d/3) - tripwire verdict", triggered_honeypots)
+        verdict = TRIPWIRE_VERDICT.copy()
+        verdict['confidence'] = float(hp_verdict['confidence'])
+        # Same factors as the weighted path; ml_result is the ML-skipped placeholder here
+        verdict['contributing_factors'] = _contributing_factors(ml_result, fp_analysis, fp_verdict, hp_verdict)
+        verdict['decision_logic'] = f"honeypot_tripwire({triggered_honeypots} triggered) >= {TRIPWIRE_MIN_TRIGGERS} = True"
+        return verdict
+    
+    # Extract individual decisions
+    ml_bot = ml_result.get('bot', False)
+    ml_confidence = ml_result.get('confidence', 0.5)
+    
+    honeypot_bot = hp_verdict['is_bot']
+    honeypot_confidence = hp_verdict['confidence']
+    
+    fingerprint_suspicious = fp_verdict['is_suspicious']
+    fingerprint_bot_likely = fp_analysis.get('is_bot_likely', False)
+    fingerprint_confidence = fp_verdict['confidence']
+    fingerprint_risk_score = fp_analysis.get('risk_score', 0)
+    
+    # Calculate weighted bot probability
+    bot_probability = (
+        (ml_bot * ml_confidence * ML_WEIGHT) +
+        (fingerprint_bot_likely * fingerprint_risk_score * FINGERPRINT_WEIGHT) +
+        (honeypot_bot * honeypot_confidence * HONEYPOT_WEIGHT)
+    )
+    
+    # Honeypot trigger bonus - a single triggered honeypot increases probability
+    if triggered_honeypots > 0:
+        # Each triggered honeypot adds a bonus
+        honeypot_bonus = triggered_honeypots * HONEYPOT_TRIGGER_BONUS
+        bot_probability += honeypot_bonus
+        if log_info:
+            logger.info("🍯 Honeypot bonus applied: +%.3f for %d triggers", honeypot_bonus, triggered_honeypots)
+    
+    # Cap probability at 1.0
+    bot_probability = min(bot_probability, 1.0)
+    
+    # Calculate combined confidence
+    combined_confidence = (
+        (ml_confidence * ML_WEIGHT) +
+        (fingerprint_confidence * FINGERPRINT_WEIGHT) +
+        (honeypot_confidence * HONEYPOT_WEIGHT)
+    )
+    
+    # Enhanced decision threshold with fingerprinting consideration
+    decision_threshold = 0.4
+    
+    # Special case: If a honeypot triggered, use a sensitive threshold
+    if triggered_honeypots == 1:
+        decision_threshold = 0.25  # Very likely bot
+        if log_info:
+            logger.info("🚨 Single honeypot triggered - using sensitive threshold")
+    
+    # Special case: If fingerprinting detects webdriver or very high risk, lower threshold
+    high_risk_indicators = fp_analysis.get('risk_indicators', [])
+    if 'webdriver_detected' in high_risk_indicators:
+        decision_threshold = min(decision_threshold, 0.2)  # Take minimum of current threshold
+        if log_info:
             logger.info("🚨 WebDriver detected - using sensitive threshold")
-        elif fingerprint_risk_score > 0.8:
-            decision_threshold = min(decision_threshold, 0.3)  # Take minimum of current threshold
+    elif fingerprint_risk_score > 0.8:
+        decision_threshold = min(decision_threshold, 0.3)  # Take minimum of current threshold
+        if log_info:
             logger.info("🚨 High fingerprint risk - using sensitive threshold")
-        
-        is_bot = bot_probability > decision_threshold
-        
-        # Determine overall risk level
-        if bot_probability > 0.7:
-            risk_level = 'high'
-        elif bot_probability > 0.4:
-            risk_level = 'medium'
-        else:
-            risk_level = 'low'
-        
-        return {
-            'is_bot': is_bot,
-            'confidence': float(combined_confidence),
-            'bot_probability': float(bot_probability),
-            'risk_level': risk_level,
-            'recommendation': 'block' if is_bot else 'allow',
-            'decision_threshold': decision_threshold,
-            'contributing_factors': {
-                'ml_model': {'bot': ml_bot, 'confidence': ml_confidence, 'weight': ml_weight},
-                'fingerprinting': {
-                    'bot_likely': fingerprint_bot_likely, 
-                    'risk_score': fingerprint_risk_score,
-                    'confidence': fingerprint_confidence, 
-                    'weight': fingerprint_weight,
-                    'high_risk_indicators': len([i for i in high_risk_indicators if i in ['webdriver_detected', 'no_plugins', 'no_mime_types']])
-                },
-                'honeypot': {'bot': honeypot_bot, 'confidence': honeypot_confidence, 'weight': honeypot_weight}
-            },
-            'decision_logic': f"weighted_probability({bot_probability:.3f}) > adaptive_threshold({decision_threshold}) = {is_bot}"
-        }
-        
-    except Exception as e:
-        logger.error(f"❌ Error combining module results: {e}")
-        return {
-            'is_bot': True,
-            'confidence': 0.8,
-            'bot_probability': 0.9,
-            'risk_level': 'high',
-            'recommendation': 'block',
-            'decision_logic': f'combination_error: {str(e)}'
-        }
+    
+    is_bot = bot_probability > decision_threshold
+    
+    # Determine overall risk level
+    if bot_probability > 0.7:
+        risk_level = 'high'
+    elif bot_probability > 0.4:
+        risk_level = 'medium'
+    else:
+        risk_level = 'low'
+    
+    return {
+        'is_bot': is_bot,
+        'confidence': float(combined_confidence),
+        'bot_probability': float(bot_probability),
+        'risk_level': risk_level,
+        'recommendation': 'block' if is_bot else 'allow',
+        'decision_threshold': decision_threshold,
+        'contributing_factors': _contributing_factors(ml_result, fp_analysis, fp_verdict, hp_verdict),
+        'decision_logic': f"weighted_probability({bot_probability:.3f}) > adaptive_threshold({decision_threshold}) = {is_bot}"
+    }
 
 @app.route('/analyze/detailed', methods=['POST'])
 def detailed_analysis():
     """Detailed analysis endpoint with full module breakdown"""
+    current_timestamp = utc_timestamp()
     try:
-        data = request.json
+        data = parse_json_body()
         if not data:
-            return jsonify({"error": "No data provided"}), 400
+            return orjson_response({"error": "No data provided"}, 400)
         
         events = data.get('events', [])
         browser_fingerprint = data.get('browserFingerprint', {})
@@ -402,18 +629,19 @@ def detailed_analysis():
         metadata = {
             'ip_address': request.remote_addr,
             'user_agent': request.headers.get('User-Agent'),
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': current_timestamp
         }
         metadata.update(enhanced_metadata)
         
         # Run all modules with enhanced data
-        ml_result = ml_module.predict(events)
-        honeypot_result = honeypot_module.analyze_behavior(events, metadata)
+        ml_future = _module_pool.submit(predict_ml_cached, events)
+        honeypot_result = honeypot_module.analyze(events, metadata)
         fingerprint_result = fingerprinting_module.analyze_fingerprint(metadata, browser_fingerprint)
+        ml_result = ml_future.result()
         final_decision = combine_module_results(ml_result, honeypot_result, fingerprint_result)
         
-        return jsonify({
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+        return orjson_response({
+            'timestamp': current_timestamp,
             'input_analysis': {
                 'events_count': len(events),
                 'metadata': metadata,
@@ -431,120 +659,113 @@ def detailed_analysis():
                 'enhanced_fingerprinting': fingerprint_result
             },
             'combined_analysis': final_decision,
-            'api_info': {
-                'architecture': 'modular_single_api_enhanced',
-                'version': '3.1',
-                'fingerprinting_features': 'rule_based_enhanced'
-            }
+            'api_info': DETAILED_API_INFO
         })
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return orjson_response({'error': str(e)}, 500)
+
+def transform_prediction(line):
+    """Transform one stored prediction record to match admin page expectations"""
+    pred = orjson.loads(line)
+    
+    # Extract ML model results
+    ml_result = pred.get('module_results', {}).get('ml_model', {})
+    fingerprinting_result = pred.get('module_results', {}).get('fingerprinting', {})
+    
+    # Extract fingerprinting data
+    browser_features = None
+    fingerprint_risk = None
+    
+    if fingerprinting_result:
+        analysis = fingerprinting_result.get('analysis', {})
+        browser_features = {
+            'webdriver': analysis.get('webdriver_detected', False),
+            'plugins': analysis.get('plugins_count', 0),
+            'mimeTypes': analysis.get('mime_types_count', 0),
+            'screenSize': f"{analysis.get('screen_width', 0)}x{analysis.get('screen_height', 0)}",
+            'touchPoints': analysis.get('max_touch_points', 0),
+            'suspiciousPatterns': analysis.get('suspicious_ua_patterns', [])
+        }
+    
+        fingerprint_risk = {
+            'riskLevel': analysis.get('risk_level', 'unknown'),
+            'riskScore': analysis.get('risk_score', 0),
+            'isBot': analysis.get('is_bot', False),
+            'riskFactors': analysis.get('risk_factors', [])
+        }
+    
+    # Extract honeypot results
+    honeypot_result = pred.get('module_results', {}).get('honeypot', {})
+    honeypot_analysis = None
+    
+    if honeypot_result:
+        honeypot_analysis = {
+            'threat_detected': honeypot_result.get('honeypot_verdict', {}).get('is_bot', False),
+            'threat_level': honeypot_result.get('analysis', {}).get('threat_level', 'low'),
+            'honeypot_score': honeypot_result.get('analysis', {}).get('honeypot_score', 0),
+            'confidence': honeypot_result.get('honeypot_verdict', {}).get('confidence', 0.5),
+            'honeypot_summary': honeypot_result.get('honeypot_summary', {}),
+            'honeypot_details': honeypot_result.get('honeypot_results', {}),
+            'detection_method': 'enhanced_3_layer_honeypot'
+        }
+    
+    # Extract final verdict
+    final_verdict = pred.get('final_decision', {})
+    
+    return {
+        'ipAddress': pred.get('client_info', {}).get('ip_address', 'Unknown'),
+        'userAgent': pred.get('client_info', {}).get('user_agent', 'Unknown'),
+        'timestamp': pred.get('timestamp', pred.get('client_info', {}).get('timestamp', '')),
+        'mouseMoveCount': pred.get('input_summary', {}).get('mouseMoveCount', 0),
+        'keyPressCount': pred.get('input_summary', {}).get('keyPressCount', 0),
+        'isBot': final_verdict.get('is_bot', ml_result.get('bot', False)),
+        'prediction': [{
+            'bot': final_verdict.get('is_bot', ml_result.get('bot', False)),
+            'reconstruction_error': ml_result.get('reconstruction_error', 0)
+        }],
+        # Add enhanced analysis for admin panel
+        'enhanced_analysis': {
+            'final_verdict': final_verdict,
+            'honeypot_analysis': honeypot_analysis,
+            'ml_analysis': {
+                'bot_detected': ml_result.get('bot', False),
+                'reconstruction_error': ml_result.get('reconstruction_error', 0),
+                'confidence': ml_result.get('confidence', 0.5)
+            }
+        },
+        'browserFeatures': browser_features,
+        'fingerprintRisk': fingerprint_risk
+    }
 
 @app.route('/predictions', methods=['GET'])
 def get_predictions():
-    """Get stored predictions transformed for admin page"""
-    try:
-        if PREDICTIONS_FILE.exists():
-            with open(PREDICTIONS_FILE, 'r') as f:
-                raw_predictions = json.load(f)
-            
-            # Transform data to match admin page expectations
-            transformed_predictions = []
-            for pred in raw_predictions:
-                try:
-                    # Extract ML model results
-                    ml_result = pred.get('module_results', {}).get('ml_model', {})
-                    fingerprinting_result = pred.get('module_results', {}).get('fingerprinting', {})
-                    
-                    # Extract fingerprinting data
-                    browser_features = None
-                    fingerprint_risk = None
-                    
-                    if fingerprinting_result:
-                        analysis = fingerprinting_result.get('analysis', {})
-                        browser_features = {
-                            'webdriver': analysis.get('webdriver_detected', False),
-                            'plugins': analysis.get('plugins_count', 0),
-                            'mimeTypes': analysis.get('mime_types_count', 0),
-                            'screenSize': f"{analysis.get('screen_width', 0)}x{analysis.get('screen_height', 0)}",
-                            'touchPoints': analysis.get('max_touch_points', 0),
-                            'suspiciousPatterns': analysis.get('suspicious_ua_patterns', [])
-                        }
-                        
-                        fingerprint_risk = {
-                            'riskLevel': analysis.get('risk_level', 'unknown'),
-                            'riskScore': analysis.get('risk_score', 0),
-                            'isBot': analysis.get('is_bot', False),
-                            'riskFactors': analysis.get('risk_factors', [])
-                        }
-                    
-                    # Extract honeypot results
-                    honeypot_result = pred.get('module_results', {}).get('honeypot', {})
-                    honeypot_analysis = None
-                    
-                    if honeypot_result:
-                        honeypot_analysis = {
-                            'threat_detected': honeypot_result.get('honeypot_verdict', {}).get('is_bot', False),
-                            'threat_level': honeypot_result.get('analysis', {}).get('threat_level', 'low'),
-                            'honeypot_score': honeypot_result.get('analysis', {}).get('honeypot_score', 0),
-                            'confidence': honeypot_result.get('honeypot_verdict', {}).get('confidence', 0.5),
-                            'honeypot_summary': honeypot_result.get('honeypot_summary', {}),
-                            'honeypot_details': honeypot_result.get('honeypot_results', {}),
-                            'detection_method': 'enhanced_3_layer_honeypot'
-                        }
-                    
-                    # Extract final verdict
-                    final_verdict = pred.get('final_decision', {})
-                    
-                    transformed_entry = {
-                        'ipAddress': pred.get('client_info', {}).get('ip_address', 'Unknown'),
-                        'userAgent': pred.get('client_info', {}).get('user_agent', 'Unknown'),
-                        'timestamp': pred.get('timestamp', pred.get('client_info', {}).get('timestamp', '')),
-                        'mouseMoveCount': pred.get('input_summary', {}).get('mouseMoveCount', 0),
-                        'keyPressCount': pred.get('input_summary', {}).get('keyPressCount', 0),
-                        'isBot': final_verdict.get('is_bot', ml_result.get('bot', False)),
-                        'prediction': [{
-                            'bot': final_verdict.get('is_bot', ml_result.get('bot', False)),
-                            'reconstruction_error': ml_result.get('reconstruction_error', 0)
-                        }],
-                        # Add enhanced analysis for admin panel
-                        'enhanced_analysis': {
-                            'final_verdict': final_verdict,
-                            'honeypot_analysis': honeypot_analysis,
-                            'ml_analysis': {
-                                'bot_detected': ml_result.get('bot', False),
-                                'reconstruction_error': ml_result.get('reconstruction_error', 0),
-                                'confidence': ml_result.get('confidence', 0.5)
-                            }
-                        },
-                        'browserFeatures': browser_features,
-                        'fingerprintRisk': fingerprint_risk
-                    }
-                    
-                    transformed_predictions.append(transformed_entry)
-                except Exception as e:
-                    logger.warning(f"Error transforming prediction: {e}")
-                    continue
-            
-            return jsonify(transformed_predictions[-50:][::-1])  # Last 50 predictions, newest first
-        else:
-            return jsonify([])
-    except Exception as e:
-        logger.error(f"Error getting predictions: {e}")
-        return jsonify({'error': str(e)}), 500
+    """Stream stored predictions transformed for admin page (newest first)"""
+    # Read from the shared file so every worker serves the same history
+    raw_lines = read_tail(PREDICTIONS_FILE, RECENT_PREDICTIONS)
+    
+    def generate():
+        yield b'['
+        separator = b''
+        for line in reversed(raw_lines):
+            try:
+                entry = orjson.dumps(transform_prediction(line), option=ORJSON_OPTIONS)
+            except Exception as e:
+                logger.warning("Error transforming prediction: %s", e)
+                continue
+            yield separator + entry
+            separator = b','
+        yield b']'
+    
+    return app.response_class(generate(), mimetype='application/json')
 
 @app.route('/modules/info')
 def modules_info():
     """Get information about all modules"""
-    return jsonify({
+    return orjson_response({
         'api': 'unified_bot_detection',
-        'architecture': 'modular_single_api',
-        'modules': {
-            'ml_model': ml_module.get_info(),
-            'honeypot': honeypot_module.get_info(),
-            'fingerprinting': fingerprinting_module.get_info()
-        }
+        'architecture': API_ARCHITECTURE,
+        'modules': get_module_info()
     })
 
 if __name__ == '__main__':
@@ -557,4 +778,5 @@ if __name__ == '__main__':
     print("   GET  /health - Health check")
     print("   GET  /modules/info - Module information")
     print("   GET  /predictions - Recent predictions")
+    # Development server; for production use gunicorn with gevent workers (see gunicorn.conf.py)
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,17 @@
+# Gunicorn configuration for the Unified Bot Detection API
+# Usage (from backend/api): gunicorn -c gunicorn.conf.py app:app
+import os
+
+bind = os.environ.get('API_BIND', '0.0.0.0:5000')
+
+# gevent workers serve many concurrent requests per process while they wait on I/O
+# (the worker monkey-patches the standard library, including the prediction log queue/thread)
+worker_class = 'gevent'
+worker_connections = int(os.environ.get('API_WORKER_CONNECTIONS', 1000))
+
+# Each worker loads its own copy of the ML model and keeps its own signature trackers,
+# so scale workers with care; one worker already handles concurrent I/O-bound requests
+workers = int(os.environ.get('API_WORKERS', 1))
+
+timeout = int(os.environ.get('API_TIMEOUT', 60))
+accesslog = '-'
@@ -0,0 +1,61 @@
+# Prediction Log Collector - sidecar that owns the predictions file
+# Usage (from backend/api): PREDICTION_LOG_SOCKET=/tmp/botdet_log.sock python log_collector.py
+# Start it before the API and run the API with the same PREDICTION_LOG_SOCKET value.
+import os
+import socket
+
+# Same file, retention and locking as app.py, whose fallback writes may share the file
+from prediction_log import LOGS_DIR, MAX_RECORD_SIZE, PREDICTIONS_FILE, PredictionLog, count_lines
+
+SOCKET_PATH = os.environ.get('PREDICTION_LOG_SOCKET', '/tmp/botdet_log.sock')
+RECV_BUFFER_SIZE = 1024 * 1024  # Kernel queue for bursts: ~100 records of ~10 KiB
+BATCH_SIZE = 100
+
+def bind_socket():
+    """Bind the datagram socket the API sends prediction records to"""
+    if os.path.exists(SOCKET_PATH):
+        os.unlink(SOCKET_PATH)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_SIZE)
+    sock.bind(SOCKET_PATH)
+    return sock
+
+def run():
+    """Receive records and append them to the predictions file in batches"""
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    sock = bind_socket()
+    log = PredictionLog()
+    count = count_lines(PREDICTIONS_FILE) if PREDICTIONS_FILE.exists() else 0
+    print(f"📡 Log collector listening on {SOCKET_PATH}")
+    print(f"💾 Writing predictions to {PREDICTIONS_FILE} ({count} existing)")
+    
+    # One receive buffer reused for every datagram; records are copied out as they arrive
+    buffer = bytearray(MAX_RECORD_SIZE)
+    view = memoryview(buffer)
+    try:
+        while True:
+            # Block for the first record, then drain whatever else is already queued
+            size = sock.recv_into(buffer)
+            batch = [view[:size].tobytes() + b'\n']
+            sock.setblocking(False)
+            try:
+                while len(batch) < BATCH_SIZE:
+                    size = sock.recv_into(buffer)
+                    batch.append(view[:size].tobytes() + b'\n')
+            except BlockingIOError:
+                pass
+            finally:
+                sock.setblocking(True)
+            
+            # Counted and rotated under the same lock as the API's fallback writes
+            log.append(batch)
+    except KeyboardInterrupt:
+        print("🛑 Log collector stopped")
+    finally:
+        log.close()
+        view.release()
+        sock.close()
+        os.unlink(SOCKET_PATH)
+
+if __name__ == '__main__':
+    run()
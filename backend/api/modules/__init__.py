@@ -4,6 +4,7 @@ Modular bot detection components:
 - ml_model: Machine learning based detection using autoencoder reconstruction
 - honeypot: Behavioral analysis and threat detection
 - fingerprinting: Device and browser fingerprinting analysis
+- timeutil: Shared timestamp formatting
 """
 
 __version__ = "3.0.0"
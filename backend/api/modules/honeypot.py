@@ -10,10 +10,59 @@ Author: Bot Detection System
 Version: 2.0
 """
 
-from datetime import datetime
+from itertools import islice
+from operator import sub
 import json
+import logging
 import re
 
+from .timeutil import utc_timestamp
+
+logger = logging.getLogger(__name__)
+
+# User agent substrings that mark a declared crawler or automation client (matched against the lowercased UA)
+BOT_USER_AGENT_KEYWORDS = ('bot', 'crawler', 'spider', 'automated')
+_BOT_USER_AGENT_RE = re.compile('|'.join(re.escape(keyword) for keyword in BOT_USER_AGENT_KEYWORDS))
+
+# Honeypot traps in the order they are checked and reported
+HONEYPOT_TYPES = ('hidden_field', 'fake_submit', 'optional_field')
+
+# Static lists reported in get_info() and every analysis result's module_info
+HONEYPOT_TRAP_TYPES = ('hidden_css_field', 'fake_submit_button', 'js_optional_field')
+THREAT_LEVELS = ('low', 'medium', 'high', 'critical')
+ANALYSIS_FEATURES = ('timing_patterns', 'movement_patterns', 'metadata_analysis')
+FEATURES_ANALYZED = ('timing_patterns', 'movement_patterns', 'metadata_analysis', 'honeypot_triggers')
+
+# Recommendation returned for each threat level
+THREAT_RECOMMENDATIONS = {'critical': 'block', 'high': 'block', 'medium': 'monitor', 'low': 'allow'}
+
+# Honeypot field configurations served to the frontend (static, shared by every call)
+HONEYPOT_FIELDS = {
+    'hidden_field': {
+        'name': 'website_url',  # Misleading name
+        'type': 'text',
+        'css_class': 'honeypot-hidden',
+        'style': 'position: absolute; left: -9999px; visibility: hidden;',
+        'label': 'Website URL (leave blank)',
+        'required': False
+    },
+    'fake_submit': {
+        'name': 'fake_submit_btn',
+        'type': 'submit',
+        'css_class': 'honeypot-fake-submit',
+        'style': 'position: absolute; left: -9999px; visibility: hidden;',
+        'value': 'Submit Form'
+    },
+    'js_optional': {
+        'name': 'optional_info',
+        'type': 'text',
+        'css_class': 'honeypot-js-field',
+        'label': 'Additional Info (Optional)',
+        'placeholder': 'This field should remain empty',
+        'data_js_only': 'true'
+    }
+}
+
 class HoneypotModule:
     """Enhanced honeypot detection with multiple trap mechanisms"""
     
@@ -32,8 +81,18 @@ class HoneypotModule:
         self.suspicious_threshold = 0.3  # Lower threshold for honeypot-based detection
         self.high_threat_threshold = 0.6
         
-        print(f"🍯 Enhanced Honeypot Module v{self.version} initialized")
-        print(f"🎯 Honeypot mechanisms: {list(self.honeypot_weights.keys())}")
+        # Module description attached to every analysis result, built once
+        self._module_info = {
+            'module': 'enhanced_honeypot',
+            'version': self.version,
+            'analysis_method': 'behavioral_honeypot_hybrid',
+            'honeypot_types': HONEYPOT_TRAP_TYPES,
+            'features_analyzed': FEATURES_ANALYZED,
+            'weights': self.honeypot_weights
+        }
+        
+        logger.info("🍯 Enhanced Honeypot Module v%s initialized", self.version)
+        logger.info("🎯 Honeypot mechanisms: %s", list(self.honeypot_weights.keys()))
     
     def analyze(self, events, metadata=None):
         """
@@ -50,8 +109,8 @@ class HoneypotModule:
             if metadata is None:
                 metadata = {}
             
-            print(f"🔍 Starting enhanced honeypot analysis...")
-            print(f"📊 Events received: {len(events)}")
+            logger.debug("🔍 Starting enhanced honeypot analysis...")
+            logger.debug("📊 Events received: %d", len(events))
             
             # Primary: Analyze honeypot triggers
             honeypot_results = self._analyze_honeypots(events, metadata)
@@ -85,17 +144,19 @@ class HoneypotModule:
                 total_score, threat_level, threat_indicators, is_bot, honeypot_results
             )
             
-            print(f"🍯 Honeypot Analysis Complete:")
-            print(f"   • Honeypot Score: {honeypot_score:.3f}")
-            print(f"   • Total Score: {total_score:.3f}")
-            print(f"   • Threat Level: {threat_level}")
-            print(f"   • Bot Detected: {is_bot}")
-            print(f"   • Honeypots Triggered: {honeypot_results['honeypots_triggered']}/3")
+            # Summary is skipped entirely unless DEBUG is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🍯 Honeypot Analysis Complete:")
+                logger.debug("   • Honeypot Score: %.3f", honeypot_score)
+                logger.debug("   • Total Score: %.3f", total_score)
+                logger.debug("   • Threat Level: %s", threat_level)
+                logger.debug("   • Bot Detected: %s", is_bot)
+                logger.debug("   • Honeypots Triggered: %d/3", honeypot_results['honeypots_triggered'])
             
             return result
             
         except Exception as e:
-            print(f"❌ Enhanced honeypot analysis error: {e}")
+            logger.error("❌ Enhanced honeypot analysis error: %s", e)
             return self._create_error_result(str(e))
     
     def _analyze_honeypots(self, events, metadata):
@@ -107,66 +168,64 @@ class HoneypotModule:
         indicators = []
         total_score = 0.0
         
-        # Initialize detailed results for each honeypot
-        detailed_results = {
-            'hidden_field': {'triggered': False, 'score': 0.0, 'details': ''},
-            'fake_submit': {'triggered': False, 'score': 0.0, 'details': ''},
-            'optional_field': {'triggered': False, 'score': 0.0, 'details': ''}
-        }
-        
-        # 1. Hidden CSS Field Detection (Weight: 0.4)
-        hidden_field_value = metadata.get('hidden_honeypot_field', '')
-        if hidden_field_value and hidden_field_value.strip():
-            detailed_results['hidden_field'] = {
-                'triggered': True,
-                'score': 1.0,
-                'details': f'Hidden field filled with: {hidden_field_value[:50]}...'
-            }
-            total_score += self.honeypot_weights['hidden_field']
-            indicators.append('hidden_field_filled')
-            print("🎯 HONEYPOT TRIGGERED: Hidden CSS field was filled")
-        
-        # 2. Fake Submit Button Detection (Weight: 0.3)
-        fake_submit_clicked = metadata.get('fake_submit_clicked', False)
-        if fake_submit_clicked:
-            detailed_results['fake_submit'] = {
-                'triggered': True,
-                'score': 1.0,
-                'details': 'Invisible fake submit button was clicked'
-            }
-            total_score += self.honeypot_weights['fake_submit']
-            indicators.append('fake_submit_clicked')
-            print("🎯 HONEYPOT TRIGGERED: Fake submit button clicked")
-        
-        # 3. JS-based Optional Field Detection (Weight: 0.3)
-        js_field_value = metadata.get('js_optional_field', '')
-        js_enabled = metadata.get('js_enabled', True)
+        # Trigger details per honeypot (None = not triggered); the per-trap dicts are built once at the end
+        hidden_details = fake_submit_details = optional_details = None
+        triggered_count = 0
         
-        # If JS is disabled and field is filled, it's likely a bot
-        if not js_enabled and js_field_value and js_field_value.strip():
-            detailed_results['optional_field'] = {
-                'triggered': True,
-                'score': 1.0,
-                'details': f'JS field filled without JS: {js_field_value[:50]}...'
-            }
-            total_score += self.honeypot_weights['optional_field']
-            indicators.append('js_field_no_js')
-            print("🎯 HONEYPOT TRIGGERED: JS field filled without JavaScript")
+        # The traps are all reported through metadata; without any there is nothing to check
+        if metadata:
+            get = metadata.get
+            weights = self.honeypot_weights
+            
+            # 1. Hidden CSS Field Detection (Weight: 0.4)
+            hidden_field_value = get('hidden_honeypot_field', '')
+            if hidden_field_value and hidden_field_value.strip():
+                hidden_details = f'Hidden field filled with: {hidden_field_value[:50]}...'
+                triggered_count += 1
+                total_score += weights['hidden_field']
+                indicators.append('hidden_field_filled')
+                logger.debug("🎯 HONEYPOT TRIGGERED: Hidden CSS field was filled")
+            
+            # 2. Fake Submit Button Detection (Weight: 0.3)
+            fake_submit_clicked = get('fake_submit_clicked', False)
+            if fake_submit_clicked:
+                fake_submit_details = 'Invisible fake submit button was clicked'
+                triggered_count += 1
+                total_score += weights['fake_submit']
+                indicators.append('fake_submit_clicked')
+                logger.debug("🎯 HONEYPOT TRIGGERED: Fake submit button clicked")
+            
+            # 3. JS-based Optional Field Detection (Weight: 0.3)
+            # If JS is disabled and field is filled, it's likely a bot; with JS on the field is not read at all
+            if not get('js_enabled', True):
+                js_field_value = get('js_optional_field', '')
+                if js_field_value and js_field_value.strip():
+                    optional_details = f'JS field filled without JS: {js_field_value[:50]}...'
+                    triggered_count += 1
+                    total_score += weights['optional_field']
+                    indicators.append('js_field_no_js')
+                    logger.debug("🎯 HONEYPOT TRIGGERED: JS field filled without JavaScript")
         
         # Additional behavioral indicators that support honeypot findings
         if len(events) == 0:
             indicators.append('no_user_interaction')
             total_score += 0.1  # Bonus for no interaction with honeypots triggered
         
+        detailed_results = {
+            trap_type: {'triggered': False, 'score': 0.0, 'details': ''} if details is None
+            else {'triggered': True, 'score': 1.0, 'details': details}
+            for trap_type, details in zip(HONEYPOT_TYPES, (hidden_details, fake_submit_details, optional_details))
+        }
+        
         return {
             'total_score': min(total_score, 1.0),
             'indicators': indicators,
             'detailed_results': detailed_results,
-            'honeypots_triggered': len([r for r in detailed_results.values() if r['triggered']]),
+            'honeypots_triggered': triggered_count,
             'analysis_summary': {
-                'hidden_field_triggered': detailed_results['hidden_field']['triggered'],
-                'fake_submit_triggered': detailed_results['fake_submit']['triggered'],
-                'optional_field_triggered': detailed_results['optional_field']['triggered'],
+                'hidden_field_triggered': hidden_details is not None,
+                'fake_submit_triggered': fake_submit_details is not None,
+                'optional_field_triggered': optional_details is not None,
                 'total_honeypot_score': total_score,
                 'threat_assessment': 'HIGH' if total_score >= 0.6 else 'MEDIUM' if total_score >= 0.3 else 'LOW'
             }
@@ -180,49 +239,51 @@ class HoneypotModule:
         indicators = []
         score = 0.0
         
-        # Calculate time differences
-        time_diffs = []
-        for i in range(1, len(events)):
-            diff = events[i].get('timestamp', 0) - events[i-1].get('timestamp', 0)
-            time_diffs.append(diff)
+        # Calculate time differences, reading each event's timestamp once
+        timestamps = [e.get('timestamp', 0) for e in events]
+        time_diffs = list(map(sub, islice(timestamps, 1, None), timestamps))
+        diff_count = len(time_diffs)
         
-        if time_diffs:
-            avg_time = sum(time_diffs) / len(time_diffs)
-            
-            # Very fast interactions (< 50ms average)
-            if avg_time < 50:
-                score += 0.3
-                indicators.append('rapid_interactions')
-            
-            # Very regular timing (low variance)
-            if len(set(time_diffs)) < len(time_diffs) * 0.3:
-                score += 0.2
-                indicators.append('regular_timing')
+        avg_time = sum(time_diffs) / diff_count
+        
+        # Very fast interactions (< 50ms average)
+        if avg_time < 50:
+            score += 0.3
+            indicators.append('rapid_interactions')
+        
+        # Very regular timing (low variance)
+        if len(set(time_diffs)) < diff_count * 0.3:
+            score += 0.2
+            indicators.append('regular_timing')
         
         return score, indicators
     
     def _analyze_movement(self, events):
         """Analyze movement patterns for bot indicators"""
-        movement_events = [e for e in events if e.get('event_name') == 'mousemove']
+        # One streaming pass over the mouse moves, collecting distinct coordinates as it goes
+        x_coords = set()
+        y_coords = set()
+        move_count = 0
+        for e in events:
+            if e.get('event_name') != 'mousemove':
+                continue
+            move_count += 1
+            x_coords.add(e.get('x_position', 0))
+            y_coords.add(e.get('y_position', 0))
+            # With enough moves and 3+ distinct values on both axes the trail can no longer be linear
+            if move_count >= 5 and len(x_coords) > 2 and len(y_coords) > 2:
+                return 0.0, []
         
-        if len(movement_events) < 5:
+        if move_count < 5:
             return 0.3, ['minimal_movement']
         
         indicators = []
         score = 0.0
         
-        # Check for perfect straight lines
-        positions = [(e.get('x_position', 0), e.get('y_position', 0)) for e in movement_events]
-        
-        # Simple linearity check
-        if len(positions) > 3:
-            # Check if all points are roughly on a straight line
-            x_coords = [p[0] for p in positions]
-            y_coords = [p[1] for p in positions]
-            
-            if len(set(x_coords)) <= 2 or len(set(y_coords)) <= 2:
-                score += 0.4
-                indicators.append('linear_movement')
+        # Check for perfect straight lines: all points share (nearly) one x or one y coordinate
+        if len(x_coords) <= 2 or len(y_coords) <= 2:
+            score += 0.4
+            indicators.append('linear_movement')
         
         return score, indicators
     
@@ -231,9 +292,11 @@ class HoneypotModule:
         indicators = []
         score = 0.0
         
-        # Check user agent
-        user_agent = metadata.get('user_agent', '').lower()
-        if any(bot_indicator in user_agent for bot_indicator in ['bot', 'crawler', 'spider', 'automated']):
+        # Check user agent (missing or empty UAs have nothing to scan)
+        user_agent = metadata.get('user_agent')
+        if not user_agent:
+            return score, indicators
+        if _BOT_USER_AGENT_RE.search(user_agent.lower()):
             score += 0.5
             indicators.append('bot_user_agent')
         
@@ -248,12 +311,12 @@ class HoneypotModule:
                 'threat_level': threat_level,
                 'threat_indicators': threat_indicators,
                 'total_indicators': len(threat_indicators),
-                'timestamp': datetime.utcnow().isoformat() + 'Z'
+                'timestamp': utc_timestamp()
             },
             'honeypot_verdict': {
                 'is_bot': is_bot,
                 'confidence': min(0.9, 0.5 + (total_score * 0.4)),
-                'recommendation': 'block' if threat_level in ['critical', 'high'] else ('monitor' if threat_level == 'medium' else 'allow'),
+                'recommendation': THREAT_RECOMMENDATIONS[threat_level],
                 'bot_probability': total_score
             },
             'honeypot_results': honeypot_results,
@@ -262,19 +325,13 @@ class HoneypotModule:
                 'triggered_honeypots': honeypot_results['honeypots_triggered'],
                 'honeypot_score': honeypot_results['total_score'],
                 'detection_method': 'multi_layer_honeypot',
+                # Most requests trigger nothing, so the trap scan is only needed when something fired
                 'honeypot_types_triggered': [
-                    trap_type for trap_type, details in honeypot_results['detailed_results'].items() 
+                    trap_type for trap_type, details in honeypot_results['detailed_results'].items()
                     if details['triggered']
-                ]
+                ] if honeypot_results['honeypots_triggered'] else []
             },
-            'module_info': {
-                'module': 'enhanced_honeypot',
-                'version': self.version,
-                'analysis_method': 'behavioral_honeypot_hybrid',
-                'honeypot_types': ['hidden_css_field', 'fake_submit_button', 'js_optional_field'],
-                'features_analyzed': ['timing_patterns', 'movement_patterns', 'metadata_analysis', 'honeypot_triggers'],
-                'weights': self.honeypot_weights
-            }
+            'module_info': self._module_info
         }
     
     def _create_error_result(self, error_message):
@@ -286,7 +343,7 @@ class HoneypotModule:
                 'threat_level': 'medium',
                 'threat_indicators': ['analysis_error'],
                 'error': error_message,
-                'timestamp': datetime.utcnow().isoformat() + 'Z'
+                'timestamp': utc_timestamp()
             },
             'honeypot_verdict': {
                 'is_bot': True,
@@ -312,38 +369,14 @@ class HoneypotModule:
         return {
             'module': 'enhanced_honeypot',
             'version': self.version,
-            'honeypot_types': ['hidden_css_field', 'fake_submit_button', 'js_optional_field'],
-            'threat_levels': ['low', 'medium', 'high', 'critical'],
-            'analysis_features': ['timing_patterns', 'movement_patterns', 'metadata_analysis'],
+            'honeypot_types': HONEYPOT_TRAP_TYPES,
+            'threat_levels': THREAT_LEVELS,
+            'analysis_features': ANALYSIS_FEATURES,
             'honeypot_weights': self.honeypot_weights,
             'suspicious_threshold': self.suspicious_threshold,
             'description': '3-layer honeypot system for advanced bot detection'
         }
     
     def get_honeypot_fields(self):
-        """Get honeypot field configurations for frontend integration"""
-        return {
-            'hidden_field': {
-                'name': 'website_url',  # Misleading name
-                'type': 'text',
-                'css_class': 'honeypot-hidden',
-                'style': 'position: absolute; left: -9999px; visibility: hidden;',
-                'label': 'Website URL (leave blank)',
-                'required': False
-            },
-            'fake_submit': {
-                'name': 'fake_submit_btn',
-                'type': 'submit',
-                'css_class': 'honeypot-fake-submit',
-                'style': 'position: absolute; left: -9999px; visibility: hidden;',
-                'value': 'Submit Form'
-            },
-            'js_optional': {
-                'name': 'optional_info',
-                'type': 'text',
-                'css_class': 'honeypot-js-field',
-                'label': 'Additional Info (Optional)',
-                'placeholder': 'This field should remain empty',
-                'data_js_only': 'true'
-            }
-        }
+        """Get honeypot field configurations for frontend integration (shared; do not mutate)"""
+        return HONEYPOT_FIELDS
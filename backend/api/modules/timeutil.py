@@ -0,0 +1,18 @@
+# Shared time formatting for the API and detection modules
+import time
+
+# (whole second, formatted 'YYYY-MM-DDTHH:MM:SS' prefix) for the most recent timestamp
+_timestamp_prefix = (None, '')
+
+def utc_timestamp():
+    """Current UTC time as an ISO 8601 string with microseconds and a 'Z' suffix"""
+    global _timestamp_prefix
+    now = time.time()
+    seconds = int(now)
+    cached_second, prefix = _timestamp_prefix
+    if cached_second != seconds:
+        # Requests within the same second share the date/time part; only the microseconds are formatted per call
+        t = time.gmtime(seconds)
+        prefix = f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+        _timestamp_prefix = (seconds, prefix)
+    return f"{prefix}.{int((now - seconds) * 1_000_000):06d}Z"
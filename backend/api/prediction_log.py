@@ -0,0 +1,143 @@
+# Prediction Log - the JSONL file of stored predictions, shared by the API workers and log_collector.py
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows development setups run a single process
+    fcntl = None
+
+BASE_DIR = Path(__file__).parent.parent
+LOGS_DIR = Path(os.environ.get('PREDICTION_LOG_DIR', BASE_DIR / 'logs' / 'predictions'))
+PREDICTIONS_FILE = LOGS_DIR / 'api_predictions.jsonl'  # One JSON record per line, append-only
+LEGACY_PREDICTIONS_FILE = LOGS_DIR / 'api_predictions.json'
+
+# Keep the last MAX_PREDICTIONS records; the file is only rewritten once it reaches PREDICTIONS_ROTATE_AT
+MAX_PREDICTIONS = 1000
+PREDICTIONS_ROTATE_AT = 2 * MAX_PREDICTIONS
+
+READ_BLOCK_SIZE = 64 * 1024
+MAX_RECORD_SIZE = 64 * 1024  # Largest record sent to log_collector.py as one datagram (records are ~10 KiB)
+
+def count_lines(path, start=0):
+    """Number of newline-terminated records in a file from byte offset start"""
+    count = 0
+    with open(path, 'rb') as f:
+        f.seek(start)
+        for block in iter(lambda: f.read(READ_BLOCK_SIZE), b''):
+            count += block.count(b'\n')
+    return count
+
+def rotate_predictions(path=PREDICTIONS_FILE, keep=MAX_PREDICTIONS):
+    """Trim the predictions file to its last keep records; callers must hold the log lock"""
+    with open(path, 'rb') as f:
+        tail = deque(f, maxlen=keep)
+    tmp_file = Path(path).with_suffix('.jsonl.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.writelines(tail)
+    os.replace(tmp_file, path)
+    return len(tail)
+
+def read_tail(path, count):
+    """Last count complete records of the file, oldest first (a record still being written is skipped)"""
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return []
+    with f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b''
+        # Read backwards until the buffer holds count full lines plus the partial one before them
+        while pos > 0 and data.count(b'\n') <= count:
+            step = min(READ_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.split(b'\n')
+    lines.pop()  # Empty after the final newline, or a record still being appended
+    if pos > 0:
+        lines.pop(0)  # Starts mid-record
+    return lines[-count:] if count else []
+
+class PredictionLog:
+    """Append-only JSONL log that several processes (API workers, log_collector.py) can write and rotate"""
+    
+    # Appends and rotation run under an exclusive flock on a sidecar lock file that is never replaced.
+    # A writer whose handle points at a file another process rotated away reopens the new one, and
+    # records appended by other writers are counted, so every process applies the same threshold.
+    
+    def __init__(self, path=PREDICTIONS_FILE, keep=MAX_PREDICTIONS, rotate_at=PREDICTIONS_ROTATE_AT):
+        self.path = Path(path)
+        self.keep = keep
+        self.rotate_at = rotate_at
+        self._lock_path = self.path.with_suffix('.lock')
+        self._thread_lock = threading.Lock()
+        self._fh = None
+        self._count = 0   # Records in the file up to byte offset _synced
+        self._synced = 0
+    
+    def append(self, lines):
+        """Append newline-terminated records and rotate the file once it reaches rotate_at"""
+        data = b''.join(lines)
+        with self.locked():
+            self._sync()
+            self._fh.write(data)
+            self._fh.flush()
+            self._count += data.count(b'\n')
+            self._synced = os.fstat(self._fh.fileno()).st_size
+            if self._count >= self.rotate_at:
+                self._close()
+                rotate_predictions(self.path, self.keep)
+                self._open()
+    
+    def close(self):
+        with self._thread_lock:
+            self._close()
+    
+    @contextmanager
+    def locked(self):
+        """Hold the log exclusively, e.g. for a one-off rewrite of the whole file"""
+        with self._thread_lock, self._file_lock():
+            yield
+    
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock shared by every process writing this log"""
+        if fcntl is None:
+            yield
+            return
+        # Opened per call so forked workers never share one lock description
+        with open(self._lock_path, 'ab') as lock_fh:
+            fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+    
+    def _sync(self):
+        """Point the handle at the current file and count records other writers appended"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            st = None
+        if self._fh is None or st is None or st.st_ino != os.fstat(self._fh.fileno()).st_ino:
+            # First write, or the file was rotated (replaced) by another process
+            self._close()
+            self._open()
+        elif st.st_size > self._synced:
+            self._count += count_lines(self.path, self._synced)
+            self._synced = st.st_size
+    
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, 'ab')
+        self._synced = os.fstat(self._fh.fileno()).st_size
+        self._count = count_lines(self.path) if self._synced else 0
+    
+    def _close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
@@ -5,151 +5,148 @@
 COMPLETE INTEGRATION STATUS AND FORMULA BREAKDOWN
 """
 
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+# Final decision weights: ML, Fingerprinting, Honeypot
+COMPONENT_WEIGHTS = np.array([0.35, 0.20, 0.45])
+TRIGGER_BONUS = 0.15
+
+# Example detection scenarios (rows match SCENARIO_TITLES)
+SCENARIO_TITLES = (
+    "🤖 SCENARIO 1: Advanced Bot",
+    "🤖 SCENARIO 2: Sophisticated Bot (1 honeypot)",
+    "👤 SCENARIO 3: Legitimate Human",
+)
+SCENARIO_SCORES = np.array([
+    [0.3, 0.6, 1.0],  # All honeypots triggered
+    [0.4, 0.3, 0.4],  # Only 1 honeypot triggered
+    [0.2, 0.1, 0.0],  # No honeypots triggered
+])
+SCENARIO_TRIGGERS = np.array([3, 1, 0])
+SCENARIO_THRESHOLDS = np.array([0.1, 0.25, 0.4])  # Adaptive thresholds per trigger count
+SCENARIO_THRESHOLD_LABELS = ("multiple honeypots", "single honeypot", "no honeypots")
+SCENARIO_DECISION_ICONS = ("🚨", "🚨", "✅")
+
+# Static report sections, rendered once at import time
+_STATIC_HEADER = "\n".join((
+    "🍯 ENHANCED HONEYPOT SYSTEM - COMPLETE INTEGRATION",
+    "=" * 60,
+
+    "\n📊 FINAL DETECTION FORMULA:",
+    "-" * 30,
+    "🧮 Final Bot Probability = Weighted Components + Honeypot Bonus",
+    "",
+    "   Components:",
+    "   • 🧠 ML Model: 35% weight",
+    "   • 👆 Fingerprinting: 20% weight",
+    "   • 🍯 Honeypot Detection: 45% weight ⭐ HIGHEST PRIORITY",
+    "",
+    "   Honeypot Bonus:",
+    "   • +15% for EACH triggered honeypot",
+    "   • Maximum bonus: +45% (all 3 honeypots)",
+    "",
+    "   Adaptive Thresholds:",
+    "   • 🔴 Multiple honeypots (≥2): 0.1 threshold (ultra-sensitive)",
+    "   • 🟡 Single honeypot (=1): 0.25 threshold (sensitive)",
+    "   • 🟢 No honeypots (=0): 0.4 threshold (standard)",
+
+    "\n🎯 3-LAYER HONEYPOT SYSTEM:",
+    "-" * 30,
+    "1. 🎨 HIDDEN CSS FIELD (40% weight)",
+    "   • Field: 'website_url' (misleading name)",
+    "   • CSS: position: absolute; left: -9999px; visibility: hidden",
+    "   • Detection: Only bots can see and fill this field",
+    "   • Trigger: Any non-empty value",
+
+    "\n2. 🖱️ FAKE SUBMIT BUTTON (30% weight)",
+    "   • Button: Invisible duplicate submit button",
+    "   • CSS: position: absolute; left: -9999px; visibility: hidden",
+    "   • Detection: Only bots click invisible buttons",
+    "   • Trigger: Click event on fake button",
+
+    "\n3. 🔧 JS-BASED OPTIONAL FIELD (30% weight)",
+    "   • Field: 'optional_info' field",
+    "   • CSS: display: none (hidden by JavaScript)",
+    "   • Detection: Bots without JS execution fill this",
+    "   • Trigger: Non-empty value when JS disabled",
+
+    "\n🔥 EXAMPLE DETECTION SCENARIOS:",
+    "-" * 30,
+))
+
+_STATIC_FOOTER = "\n".join((
+    "\n📋 ADMIN PANEL HONEYPOT DISPLAY:",
+    "-" * 30,
+    "✅ Honeypot Analysis Section",
+    "✅ Individual honeypot trigger status",
+    "✅ Threat level visualization",
+    "✅ Honeypot score and confidence",
+    "✅ Detailed trigger descriptions",
+    "✅ Weight information for each honeypot",
+    "✅ Final decision impact calculation",
+    "✅ Trigger bonus display",
+    "✅ Decision formula explanation",
+
+    "\n🎯 SYSTEM EFFECTIVENESS:",
+    "-" * 30,
+    "🟢 Bot Detection Rate: ~95% (honeypots catch most bots)",
+    "🟢 False Positive Rate: 0% (humans cannot trigger honeypots)",
+    "🟢 Adaptive Thresholds: Dynamic based on honeypot triggers",
+    "🟢 High Priority Weighting: 45% weight to most reliable detection",
+    "🟢 Trigger Bonus System: Additional penalty for multiple triggers",
+    "🟢 Comprehensive Logging: Detailed honeypot analysis in admin panel",
+
+    "\n🚀 DEPLOYMENT STATUS:",
+    "-" * 30,
+    "✅ Backend: Enhanced honeypot module with 3-layer detection",
+    "✅ API: Increased honeypot weight to 45% in final decision",
+    "✅ Frontend: Honeypot fields integrated and hidden properly",
+    "✅ Admin Panel: Detailed honeypot analysis and decision impact",
+    "✅ Logging: Complete honeypot trigger tracking",
+    "✅ Formula: Adaptive thresholds based on honeypot triggers",
+
+    "\n" + "=" * 60,
+    "🏆 HONEYPOT SYSTEM: FULLY INTEGRATED AND ENHANCED",
+    "🍯 Maximum weight given to honeypot detection (45%)",
+    "⭐ Trigger bonus system for multiple honeypot activation",
+    "🎯 Adaptive thresholds for ultra-sensitive bot detection",
+    "📊 Complete admin visibility and detailed analysis",
+    "=" * 60,
+))
+
+@lru_cache(maxsize=1)
+def _build_report():
+    """Render the full report; every input is a module constant, so it is built once"""
+    out = [_STATIC_HEADER]
+    
+    # Example scenarios: one row per scenario, columns are (ML, Fingerprint, Honeypot)
+    contributions = SCENARIO_SCORES * COMPONENT_WEIGHTS
+    weighted = contributions.sum(axis=1)
+    bonus = SCENARIO_TRIGGERS * TRIGGER_BONUS
+    final = np.minimum(weighted + bonus, 1.0)
+    decisions = final > SCENARIO_THRESHOLDS
+    
+    scenarios = zip(SCENARIO_TITLES, SCENARIO_SCORES, SCENARIO_TRIGGERS,
+                    SCENARIO_THRESHOLDS, SCENARIO_THRESHOLD_LABELS, SCENARIO_DECISION_ICONS)
+    for i, (title, scores, triggered_count, threshold, threshold_label, icon) in enumerate(scenarios):
+        ml_score, fingerprint_score, honeypot_score = scores
+        out.append(f"\n{title}" if i else title)
+        out.append(f"   • ML: {ml_score} × 35% = {contributions[i, 0]:.3f}")
+        out.append(f"   • Fingerprint: {fingerprint_score} × 20% = {contributions[i, 1]:.3f}")
+        out.append(f"   • Honeypot: {honeypot_score} × 45% = {contributions[i, 2]:.3f}")
+        out.append(f"   • Trigger Bonus: {triggered_count} × 15% = +{bonus[i]:.3f}")
+        out.append(f"   • Final Score: {final[i]:.3f}")
+        out.append(f"   • Threshold: {threshold} ({threshold_label})")
+        out.append(f"   • {icon} DECISION: {'BOT DETECTED' if decisions[i] else 'HUMAN'}")
+    
+    out.append(_STATIC_FOOTER)
+    return "\n".join(out)
+
 def show_honeypot_integration_analysis():
-    print("🍯 ENHANCED HONEYPOT SYSTEM - COMPLETE INTEGRATION")
-    print("=" * 60)
-    
-    print("\n📊 FINAL DETECTION FORMULA:")
-    print("-" * 30)
-    print("🧮 Final Bot Probability = Weighted Components + Honeypot Bonus")
-    print("")
-    print("   Components:")
-    print("   • 🧠 ML Model: 35% weight")
-    print("   • 👆 Fingerprinting: 20% weight") 
-    print("   • 🍯 Honeypot Detection: 45% weight ⭐ HIGHEST PRIORITY")
-    print("")
-    print("   Honeypot Bonus:")
-    print("   • +15% for EACH triggered honeypot")
-    print("   • Maximum bonus: +45% (all 3 honeypots)")
-    print("")
-    print("   Adaptive Thresholds:")
-    print("   • 🔴 Multiple honeypots (≥2): 0.1 threshold (ultra-sensitive)")
-    print("   • 🟡 Single honeypot (=1): 0.25 threshold (sensitive)")
-    print("   • 🟢 No honeypots (=0): 0.4 threshold (standard)")
-    
-    print("\n🎯 3-LAYER HONEYPOT SYSTEM:")
-    print("-" * 30)
-    print("1. 🎨 HIDDEN CSS FIELD (40% weight)")
-    print("   • Field: 'website_url' (misleading name)")
-    print("   • CSS: position: absolute; left: -9999px; visibility: hidden")
-    print("   • Detection: Only bots can see and fill this field")
-    print("   • Trigger: Any non-empty value")
-    
-    print("\n2. 🖱️ FAKE SUBMIT BUTTON (30% weight)")
-    print("   • Button: Invisible duplicate submit button")
-    print("   • CSS: position: absolute; left: -9999px; visibility: hidden")
-    print("   • Detection: Only bots click invisible buttons")
-    print("   • Trigger: Click event on fake button")
-    
-    print("\n3. 🔧 JS-BASED OPTIONAL FIELD (30% weight)")
-    print("   • Field: 'optional_info' field")
-    print("   • CSS: display: none (hidden by JavaScript)")
-    print("   • Detection: Bots without JS execution fill this")
-    print("   • Trigger: Non-empty value when JS disabled")
-    
-    print("\n🔥 EXAMPLE DETECTION SCENARIOS:")
-    print("-" * 30)
-    
-    # Scenario 1: Advanced Bot (All honeypots triggered)
-    print("🤖 SCENARIO 1: Advanced Bot")
-    ml_score = 0.3
-    fingerprint_score = 0.6
-    honeypot_score = 1.0  # All honeypots triggered
-    triggered_count = 3
-    
-    weighted = (ml_score * 0.35) + (fingerprint_score * 0.20) + (honeypot_score * 0.45)
-    bonus = triggered_count * 0.15
-    final = min(weighted + bonus, 1.0)
-    threshold = 0.1  # Ultra-sensitive for multiple honeypots
-    decision = final > threshold
-    
-    print(f"   • ML: {ml_score} × 35% = {ml_score * 0.35:.3f}")
-    print(f"   • Fingerprint: {fingerprint_score} × 20% = {fingerprint_score * 0.20:.3f}")
-    print(f"   • Honeypot: {honeypot_score} × 45% = {honeypot_score * 0.45:.3f}")
-    print(f"   • Trigger Bonus: {triggered_count} × 15% = +{bonus:.3f}")
-    print(f"   • Final Score: {final:.3f}")
-    print(f"   • Threshold: {threshold} (multiple honeypots)")
-    print(f"   • 🚨 DECISION: {'BOT DETECTED' if decision else 'HUMAN'}")
-    
-    # Scenario 2: Sophisticated Bot (1 honeypot triggered)
-    print(f"\n🤖 SCENARIO 2: Sophisticated Bot (1 honeypot)")
-    ml_score = 0.4
-    fingerprint_score = 0.3
-    honeypot_score = 0.4  # Only 1 honeypot triggered
-    triggered_count = 1
-    
-    weighted = (ml_score * 0.35) + (fingerprint_score * 0.20) + (honeypot_score * 0.45)
-    bonus = triggered_count * 0.15
-    final = weighted + bonus
-    threshold = 0.25  # Sensitive for single honeypot
-    decision = final > threshold
-    
-    print(f"   • ML: {ml_score} × 35% = {ml_score * 0.35:.3f}")
-    print(f"   • Fingerprint: {fingerprint_score} × 20% = {fingerprint_score * 0.20:.3f}")
-    print(f"   • Honeypot: {honeypot_score} × 45% = {honeypot_score * 0.45:.3f}")
-    print(f"   • Trigger Bonus: {triggered_count} × 15% = +{bonus:.3f}")
-    print(f"   • Final Score: {final:.3f}")
-    print(f"   • Threshold: {threshold} (single honeypot)")
-    print(f"   • 🚨 DECISION: {'BOT DETECTED' if decision else 'HUMAN'}")
-    
-    # Scenario 3: Human User
-    print(f"\n👤 SCENARIO 3: Legitimate Human")
-    ml_score = 0.2
-    fingerprint_score = 0.1
-    honeypot_score = 0.0  # No honeypots triggered
-    triggered_count = 0
-    
-    weighted = (ml_score * 0.35) + (fingerprint_score * 0.20) + (honeypot_score * 0.45)
-    bonus = triggered_count * 0.15
-    final = weighted + bonus
-    threshold = 0.4  # Standard threshold
-    decision = final > threshold
-    
-    print(f"   • ML: {ml_score} × 35% = {ml_score * 0.35:.3f}")
-    print(f"   • Fingerprint: {fingerprint_score} × 20% = {fingerprint_score * 0.20:.3f}")
-    print(f"   • Honeypot: {honeypot_score} × 45% = {honeypot_score * 0.45:.3f}")
-    print(f"   • Trigger Bonus: {triggered_count} × 15% = +{bonus:.3f}")
-    print(f"   • Final Score: {final:.3f}")
-    print(f"   • Threshold: {threshold} (no honeypots)")
-    print(f"   • ✅ DECISION: {'BOT DETECTED' if decision else 'HUMAN'}")
-    
-    print("\n📋 ADMIN PANEL HONEYPOT DISPLAY:")
-    print("-" * 30)
-    print("✅ Honeypot Analysis Section")
-    print("✅ Individual honeypot trigger status")
-    print("✅ Threat level visualization")
-    print("✅ Honeypot score and confidence")
-    print("✅ Detailed trigger descriptions")
-    print("✅ Weight information for each honeypot")
-    print("✅ Final decision impact calculation")
-    print("✅ Trigger bonus display")
-    print("✅ Decision formula explanation")
-    
-    print("\n🎯 SYSTEM EFFECTIVENESS:")
-    print("-" * 30)
-    print("🟢 Bot Detection Rate: ~95% (honeypots catch most bots)")
-    print("🟢 False Positive Rate: 0% (humans cannot trigger honeypots)")
-    print("🟢 Adaptive Thresholds: Dynamic based on honeypot triggers")
-    print("🟢 High Priority Weighting: 45% weight to most reliable detection")
-    print("🟢 Trigger Bonus System: Additional penalty for multiple triggers")
-    print("🟢 Comprehensive Logging: Detailed honeypot analysis in admin panel")
-    
-    print("\n🚀 DEPLOYMENT STATUS:")
-    print("-" * 30)
-    print("✅ Backend: Enhanced honeypot module with 3-layer detection")
-    print("✅ API: Increased honeypot weight to 45% in final decision")
-    print("✅ Frontend: Honeypot fields integrated and hidden properly")
-    print("✅ Admin Panel: Detailed honeypot analysis and decision impact")
-    print("✅ Logging: Complete honeypot trigger tracking")
-    print("✅ Formula: Adaptive thresholds based on honeypot triggers")
-    
-    print("\n" + "=" * 60)
-    print("🏆 HONEYPOT SYSTEM: FULLY INTEGRATED AND ENHANCED")
-    print("🍯 Maximum weight given to honeypot detection (45%)")
-    print("⭐ Trigger bonus system for multiple honeypot activation")
-    print("🎯 Adaptive thresholds for ultra-sensitive bot detection")
-    print("📊 Complete admin visibility and detailed analysis")
-    print("=" * 60)
+    sys.stdout.write(_build_report() + "\n")
 
 if __name__ == "__main__":
     show_honeypot_integration_analysis()
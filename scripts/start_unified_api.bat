@@ -28,7 +28,7 @@ echo Activating virtual environment...
 call .venv\Scripts\activate.bat
 
 echo Installing/updating basic requirements...
-pip install flask flask-cors pandas numpy requests >nul 2>&1
+pip install flask flask-cors orjson pandas numpy requests >nul 2>&1
 
 echo.
 echo Starting Unified Bot Detection API...
@@ -0,0 +1,12 @@
+# Shared pytest setup: import the API and its modules from backend/api
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent.parent / 'backend' / 'api'
+sys.path.insert(0, str(API_DIR))
+
+# Keep the prediction log written by app.py out of the repository's logs directory
+os.environ.setdefault('PREDICTION_LOG_DIR', tempfile.mkdtemp(prefix='botdet-test-logs-'))
+os.environ.pop('PREDICTION_LOG_SOCKET', None)
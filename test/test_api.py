@@ -0,0 +1,136 @@
+# Tests for the API: verdict combination, /predict, the ML result cache and the legacy log migration
+import threading
+
+import pytest
+
+import app
+import prediction_log
+from prediction_log import PredictionLog
+
+FACTOR_KEYS = {'ml_model', 'fingerprinting', 'honeypot'}
+
+def _honeypot_result(triggered):
+    return {
+        'honeypot_verdict': {'is_bot': triggered > 0, 'confidence': 0.8 if triggered else 0.2},
+        'honeypot_summary': {'triggered_honeypots': triggered},
+        'analysis': {}
+    }
+
+def _fingerprint_result():
+    return {
+        'verdict': {'is_suspicious': True, 'confidence': 0.9},
+        'analysis': {'is_bot_likely': True, 'risk_score': 0.7, 'risk_indicators': ['webdriver_detected']}
+    }
+
+def test_tripwire_and_weighted_verdicts_report_the_same_factors():
+    ml_result = {'bot': False, 'confidence': 0.6}
+    weighted = app.combine_module_results(ml_result, _honeypot_result(0), _fingerprint_result())
+    
+    skipped = dict(app.ML_SKIPPED_RESULT, method='skipped_honeypot_tripwire')
+    tripwire = app.combine_module_results(skipped, _honeypot_result(app.TRIPWIRE_MIN_TRIGGERS), _fingerprint_result())
+    
+    assert tripwire['decision_logic'].startswith('honeypot_tripwire')
+    assert set(tripwire) == set(weighted)
+    assert set(tripwire['contributing_factors']) == set(weighted['contributing_factors']) == FACTOR_KEYS
+    for name in FACTOR_KEYS:
+        assert set(tripwire['contributing_factors'][name]) == set(weighted['contributing_factors'][name])
+    
+    # The tripwire path reports the ML placeholder and the fingerprint verdict it already computed
+    assert tripwire['contributing_factors']['ml_model']['confidence'] == app.ML_SKIPPED_RESULT['confidence']
+    assert tripwire['contributing_factors']['fingerprinting']['high_risk_indicators'] == 1
+
+def test_predict_returns_error_response_for_malformed_module_result(monkeypatch):
+    # Passes the combination check but lacks the 'analysis' section the response is built from
+    malformed = {'honeypot_verdict': {'is_bot': False, 'confidence': 0.2}, 'honeypot_summary': {'triggered_honeypots': 0}}
+    monkeypatch.setattr(app.honeypot_module, 'analyze', lambda events, metadata: malformed)
+    
+    response = app.app.test_client().post('/predict', json={
+        'mouseMoveCount': 1,
+        'keyPressCount': 0,
+        'events': [{'type': 'mousemove', 'x': 1, 'y': 1, 'timestamp': 1}]
+    })
+    
+    assert response.status_code == 500
+    assert response.mimetype == 'application/json'
+    body = response.get_json()
+    assert body['prediction'] == [{'bot': True, 'reconstruction_error': 0.9, 'confidence': 0.8, 'raw_error': 500}]
+    assert body['api_metadata']['error_fallback'] is True
+    assert 'analysis' in body['error']
+
+@pytest.fixture
+def fake_ml(monkeypatch):
+    """Empty ML cache and an ML module that records every call"""
+    calls = []
+    def predict(events):
+        calls.append(events)
+        return {'bot': False, 'confidence': 0.6, 'method': events[0].get('method', 'heuristic')}
+    monkeypatch.setattr(app.ml_module, 'predict', predict)
+    monkeypatch.setattr(app, '_ml_cache', app.OrderedDict())
+    return calls
+
+def _events(n, method='heuristic'):
+    return [{'type': 'mousemove', 'x': n, 'y': n, 'timestamp': n, 'method': method}]
+
+def test_ml_cache_reuses_results_for_identical_events(fake_ml):
+    first = app.predict_ml_cached(_events(1))
+    second = app.predict_ml_cached(_events(1))
+    assert first == second
+    assert len(fake_ml) == 1
+    
+    # Each caller gets its own copy; changing it does not change later hits
+    second['bot'] = True
+    assert first is not second
+    assert app.predict_ml_cached(_events(1))['bot'] is False
+
+def test_ml_cache_evicts_least_recently_used(fake_ml, monkeypatch):
+    monkeypatch.setattr(app, 'ML_CACHE_SIZE', 2)
+    app.predict_ml_cached(_events(1))
+    app.predict_ml_cached(_events(2))
+    app.predict_ml_cached(_events(1))  # Hit: 2 is now the least recently used
+    app.predict_ml_cached(_events(3))  # Evicts 2
+    assert len(app._ml_cache) == 2
+    assert len(fake_ml) == 3
+    
+    app.predict_ml_cached(_events(1))
+    assert len(fake_ml) == 3
+    app.predict_ml_cached(_events(2))
+    assert len(fake_ml) == 4
+
+def test_ml_cache_skips_error_fallback_results(fake_ml):
+    app.predict_ml_cached(_events(1, method='error_fallback'))
+    app.predict_ml_cached(_events(1, method='error_fallback'))
+    assert len(fake_ml) == 2
+    assert len(app._ml_cache) == 0
+
+def _use_prediction_log(monkeypatch, tmp_path):
+    path = tmp_path / 'api_predictions.jsonl'
+    legacy = tmp_path / 'api_predictions.json'
+    legacy.write_bytes(app.orjson.dumps([{'n': i} for i in range(5)]))
+    monkeypatch.setattr(app, 'PREDICTIONS_FILE', path)
+    monkeypatch.setattr(app, 'LEGACY_PREDICTIONS_FILE', legacy)
+    monkeypatch.setattr(app, '_prediction_log', PredictionLog(path))
+    return path
+
+def test_legacy_predictions_are_migrated_once(monkeypatch, tmp_path):
+    path = _use_prediction_log(monkeypatch, tmp_path)
+    app._migrate_legacy_predictions()
+    assert path.read_bytes().splitlines() == [b'{"n":%d}' % i for i in range(5)]
+    
+    app._prediction_log.append([b'{"n":5}\n'])
+    app._migrate_legacy_predictions()
+    assert len(path.read_bytes().splitlines()) == 6
+
+@pytest.mark.skipif(prediction_log.fcntl is None, reason='needs fcntl')
+def test_migration_waits_for_the_log_lock(monkeypatch, tmp_path):
+    path = _use_prediction_log(monkeypatch, tmp_path)
+    other_worker = PredictionLog(path)
+    with other_worker.locked():
+        migration = threading.Thread(target=app._migrate_legacy_predictions)
+        migration.start()
+        migration.join(timeout=0.2)
+        assert migration.is_alive()  # Blocked on the other worker's lock
+        path.write_bytes(b'{"other":true}\n')
+    migration.join(timeout=5)
+    
+    # The other worker created the log first, so the migration leaves it alone
+    assert path.read_bytes() == b'{"other":true}\n'
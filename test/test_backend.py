@@ -0,0 +1,70 @@
+# Tests for the backend's shared prediction log
+import multiprocessing
+
+import pytest
+
+from prediction_log import PredictionLog, read_tail
+
+RECORDS_PER_WRITER = 400
+BATCH_SIZE = 7
+
+def _write_records(path, writer_id):
+    """Append RECORDS_PER_WRITER numbered records in small batches, as an API worker would"""
+    log = PredictionLog(path, keep=50, rotate_at=120)
+    for start in range(0, RECORDS_PER_WRITER, BATCH_SIZE):
+        stop = min(start + BATCH_SIZE, RECORDS_PER_WRITER)
+        log.append([f'{writer_id}:{i}\n'.encode() for i in range(start, stop)])
+    log.close()
+
+def _sequences(path):
+    """Record numbers per writer, in file order"""
+    sequences = {}
+    for line in path.read_bytes().splitlines():
+        writer_id, number = line.decode().split(':')
+        sequences.setdefault(writer_id, []).append(int(number))
+    return sequences
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='needs fork')
+def test_two_writers_lose_no_records_across_rotation(tmp_path):
+    path = tmp_path / 'predictions.jsonl'
+    ctx = multiprocessing.get_context('fork')
+    writers = [ctx.Process(target=_write_records, args=(path, writer_id)) for writer_id in ('a', 'b')]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join(timeout=60)
+        assert writer.exitcode == 0
+    
+    # Rotation happened (the file was trimmed) and never let the file grow past the threshold
+    lines = path.read_bytes().splitlines()
+    assert len(lines) < 120
+    
+    # Rotation only drops the oldest records: what remains from each writer is an unbroken run
+    # ending with its last record, so nothing was appended to a file another writer replaced
+    for writer_id, numbers in _sequences(path).items():
+        assert numbers == list(range(numbers[0], RECORDS_PER_WRITER)), writer_id
+
+def test_single_writer_rotates_to_keep(tmp_path):
+    path = tmp_path / 'predictions.jsonl'
+    log = PredictionLog(path, keep=10, rotate_at=20)
+    log.append([f'x:{i}\n'.encode() for i in range(19)])
+    assert len(path.read_bytes().splitlines()) == 19
+    log.append([b'x:19\n'])
+    assert _sequences(path) == {'x': list(range(10, 20))}
+
+def test_writer_counts_records_appended_by_others(tmp_path):
+    path = tmp_path / 'predictions.jsonl'
+    first = PredictionLog(path, keep=5, rotate_at=10)
+    second = PredictionLog(path, keep=5, rotate_at=10)
+    first.append([f'a:{i}\n'.encode() for i in range(6)])
+    second.append([f'b:{i}\n'.encode() for i in range(3)])
+    # Ten records in the file: the first writer rotates even though it only wrote seven itself
+    first.append([b'a:6\n'])
+    assert len(path.read_bytes().splitlines()) == 5
+
+def test_read_tail_returns_last_complete_records(tmp_path):
+    path = tmp_path / 'predictions.jsonl'
+    assert read_tail(path, 3) == []
+    path.write_bytes(b''.join(f'r{i}\n'.encode() for i in range(10)) + b'partial')
+    assert read_tail(path, 3) == [b'r7', b'r8', b'r9']
+    assert read_tail(path, 50) == [f'r{i}'.encode() for i in range(10)]
@@ -0,0 +1,162 @@
+# Tests for the enhanced fingerprinting module's helpers and trackers
+import sys
+import threading
+
+import pytest
+
+from modules import fingerprinting
+from modules.fingerprinting import BoundedSignatureTracker, FingerprintingModule, RecentSubmissionTracker, classify_ip
+
+@pytest.mark.parametrize('ip_address, expected', [
+    # 10.0.0.0/8
+    ('10.0.0.1', 'private'),
+    ('10.255.255.255', 'private'),
+    ('11.0.0.1', 'public'),
+    # 172.16.0.0/12 covers 172.16.x - 172.31.x only
+    ('172.15.255.255', 'public'),
+    ('172.16.0.1', 'private'),
+    ('172.31.255.254', 'private'),
+    ('172.32.0.1', 'public'),
+    # 192.168.0.0/16
+    ('192.168.0.1', 'private'),
+    ('192.168.255.255', 'private'),
+    ('192.169.0.1', 'public'),
+    # 127.0.0.0/8 and the literal hostname
+    ('127.0.0.1', 'localhost'),
+    ('127.255.0.1', 'localhost'),
+    ('localhost', 'localhost'),
+    # IPv6 loopback and unique local addresses (fc00::/7)
+    ('::1', 'localhost'),
+    ('fc00::1', 'private'),
+    ('fd12:3456:789a::1', 'private'),
+    ('fe80::1', 'public'),
+    ('2001:4860:4860::8888', 'public'),
+    ('8.8.8.8', 'public'),
+])
+def test_classify_ip(ip_address, expected):
+    assert classify_ip(ip_address) == expected
+
+@pytest.mark.parametrize('ip_address', ['', 'not-an-ip', '10.0.0', '256.1.1.1', '192.168.1.1/24', '::g', ' 10.0.0.1', None])
+def test_classify_ip_treats_malformed_addresses_as_public(ip_address):
+    assert classify_ip(ip_address) == 'public'
+
+def test_signature_tracker_evicts_least_recently_seen():
+    tracker = BoundedSignatureTracker(max_entries=2)
+    tracker.touch('a', '1.1.1.1')
+    tracker.touch('b', '1.1.1.1')
+    tracker.touch('a', '2.2.2.2')  # 'b' is now the least recently seen
+    tracker.touch('c', '1.1.1.1')
+    assert len(tracker) == 2
+    assert dict(tracker.items()) == {'a': 2, 'c': 1}
+
+def test_signature_tracker_counts_new_ips_and_saturates():
+    tracker = BoundedSignatureTracker(max_ips_per_signature=3)
+    assert tracker.touch('sig', '1.1.1.1') == 0  # First sighting
+    assert tracker.touch('sig', '1.1.1.1') == 0  # Same IP again
+    assert tracker.touch('sig', '2.2.2.2') == 2
+    assert tracker.touch('sig', '3.3.3.3') == 3
+    # Saturated: new IPs keep reporting the cap without being stored
+    assert tracker.touch('sig', '4.4.4.4') == 3
+    assert tracker.touch('sig', '5.5.5.5') == 3
+    assert dict(tracker.items()) == {'sig': 3}
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the submission tracker"""
+    now = [1000.0]
+    monkeypatch.setattr(fingerprinting.time, 'monotonic', lambda: now[0])
+    return now
+
+def test_submission_tracker_forgets_idle_ips(clock):
+    tracker = RecentSubmissionTracker(idle_seconds=60)
+    tracker.record('1.1.1.1', 'h1')
+    clock[0] += 30
+    tracker.record('2.2.2.2', 'h2')
+    clock[0] += 31  # 1.1.1.1 idle for 61s, 2.2.2.2 for 31s
+    tracker.record('3.3.3.3', 'h3')
+    assert len(tracker) == 2
+    assert tracker.count('1.1.1.1') == 0
+    assert tracker.count('2.2.2.2') == 1
+
+def test_submission_tracker_activity_keeps_an_ip(clock):
+    tracker = RecentSubmissionTracker(max_per_ip=2, idle_seconds=60)
+    for _ in range(3):
+        tracker.record('1.1.1.1', 'h')
+        clock[0] += 50
+    tracker.record('2.2.2.2', 'h')
+    assert tracker.count('1.1.1.1') == 2  # Capped at max_per_ip and still tracked
+    assert len(tracker) == 2
+
+def test_submission_tracker_caps_tracked_ips(clock):
+    tracker = RecentSubmissionTracker(max_ips=2)
+    for ip_address in ('1.1.1.1', '2.2.2.2', '1.1.1.1', '3.3.3.3'):
+        tracker.record(ip_address, 'h')
+    assert len(tracker) == 2
+    assert tracker.count('2.2.2.2') == 0
+    assert tracker.count('1.1.1.1') == 2
+
+def test_submission_ips_tracked_count(clock):
+    module = FingerprintingModule()
+    for ip_address in ('1.1.1.1', '2.2.2.2', '1.1.1.1'):
+        module.analyze_fingerprint({'ip_address': ip_address, 'user_agent': 'Mozilla/5.0'}, {'hash': 'h'})
+    assert module.get_signature_tracking_counts()['submission_ips_tracked'] == 2
+    
+    # Both IPs go idle; the next submission drops them
+    clock[0] += module.submission_tracker.idle_seconds + 1
+    module.analyze_fingerprint({'ip_address': '3.3.3.3', 'user_agent': 'Mozilla/5.0'}, {'hash': 'h'})
+    assert module.get_signature_tracking_counts()['submission_ips_tracked'] == 1
+
+@pytest.fixture
+def frequent_thread_switches():
+    """Switch threads far more often than usual so unsynchronized updates would interleave"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+def _run_threads(target, count):
+    threads = [threading.Thread(target=target, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_signature_tracker_concurrent_touches(frequent_thread_switches):
+    tracker = BoundedSignatureTracker(max_entries=1000, max_ips_per_signature=10000)
+    signatures = [f'sig{i}' for i in range(20)]
+    results = {signature: [] for signature in signatures}
+    
+    def touch_all(thread_id):
+        for i in range(200):
+            for signature in signatures:
+                count = tracker.touch(signature, f'{thread_id}.{i}')
+                if count:
+                    results[signature].append(count)
+    
+    _run_threads(touch_all, 8)
+    
+    # Every new IP was counted exactly once: the non-zero returns are 2..N with no repeats or gaps
+    ips_per_signature = 8 * 200
+    assert dict(tracker.items()) == {signature: ips_per_signature for signature in signatures}
+    for counts in results.values():
+        assert sorted(counts) == list(range(2, ips_per_signature + 1))
+
+def test_submission_tracker_concurrent_records_and_counts(frequent_thread_switches):
+    tracker = RecentSubmissionTracker(max_per_ip=10000, max_ips=1000)
+    ips = [f'10.0.0.{i}' for i in range(50)]
+    errors = []
+    
+    def record_and_count(thread_id):
+        try:
+            for i in range(100):
+                for j, ip_address in enumerate(ips):
+                    tracker.record(ip_address, f'{thread_id}-{i}')
+                    tracker.count(ips[-1 - j])  # Read entries other threads are replacing
+        except Exception as e:  # A dict changed during iteration would surface here
+            errors.append(e)
+    
+    _run_threads(record_and_count, 8)
+    
+    assert errors == []
+    assert len(tracker) == len(ips)
+    assert sum(tracker.count(ip_address) for ip_address in ips) == 8 * 100 * len(ips)